@@ -1,25 +1,21 @@
 import os
+import sys
+import atexit
 import argparse
 
-from grundy.core.engine import Engine
+from grundy.core.computer import TABLE_ENGINES, DEFAULT_TABLE_ENGINE
+from grundy.core.engine import Engine, DEFAULT_TARGET_FPS
 from grundy.core.events import EventType
+from grundy.core.profiling import EventProfiler
 from grundy.scenes.play import PlayScene
 from grundy.scenes.gameover import GameOverScene
 from grundy.scenes.menu import MenuScene
+from grundy.utils.cli import pilesize, positive_float
 from grundy.utils.palettes import PALETTES, DEFAULT_PALETTE
 
 ICON_PATH = os.path.join(os.path.dirname(__file__), "assets", "atom.ico")
 
 
-def pilesize(value):
-    """
-    Custom type for argparse that ensures pile sizes are at least 3.
-    """
-    ivalue = int(value)
-    if ivalue < 3:
-        raise argparse.ArgumentTypeError(f"Pile size must be at least 3 (got {ivalue})")
-    return ivalue
-
 def parse_args() -> argparse.Namespace:
     """
     Parse command-line arguments for game settings.
@@ -37,6 +33,26 @@ def parse_args() -> argparse.Namespace:
         "--theme", "--palette", choices=list(PALETTES.keys()),
         default=DEFAULT_PALETTE, help=f"choose the color palette (default: '{DEFAULT_PALETTE}')"
     )
+    parser.add_argument(
+        "--grundy-engine", choices=TABLE_ENGINES, default=DEFAULT_TABLE_ENGINE,
+        help=f"choose the backend computing Grundy values (default: '{DEFAULT_TABLE_ENGINE}')"
+    )
+    parser.add_argument(
+        "--grundy-table", metavar="PATH",
+        help="load and save computed Grundy values in this file (default: disabled)"
+    )
+    parser.add_argument(
+        "--fps", type=positive_float, default=DEFAULT_TARGET_FPS,
+        help=f"set the target number of frames per second (default: {DEFAULT_TARGET_FPS})"
+    )
+    parser.add_argument(
+        "--fixed-quality", action="store_true",
+        help="keep full visual quality instead of lowering it when frames run late (default: False)"
+    )
+    parser.add_argument(
+        "--profile-events", metavar="PATH", nargs="?", const="-",
+        help="time every event listener and write the results at exit, as JSON if PATH ends with '.json' (default: disabled, '-' for stdout)"
+    )
     parser.add_argument(
         "--scene", choices=["menu", "play", "gameover"],
         default="menu",help="choose the initial scene to start (default: 'menu')"
@@ -45,6 +61,18 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def write_event_profile(profiler: EventProfiler, path: str) -> None:
+    """
+    Write the listener timings to a file, or to stdout for '-'.
+    """
+    fmt = "json" if path.endswith(".json") else "table"
+    if path == "-":
+        profiler.dump(sys.stdout, fmt)
+        return
+    with open(path, "w", encoding="utf-8") as file:
+        profiler.dump(file, fmt)
+
+
 def main() -> None:
     args = parse_args()
     print(args)
@@ -52,17 +80,25 @@ def main() -> None:
     engine = Engine()
     engine.viewport.title("Grundy's Game")
     engine.viewport.geometry(f"{args.width}x{args.height}")
+    engine.viewport.refresh_size()
 
     engine.theme.set(args.theme)
+    engine.set_target_fps(args.fps)
+    engine.quality.set_enabled(not args.fixed_quality)
 
     if os.path.exists(ICON_PATH):
         engine.viewport.iconbitmap(ICON_PATH)
     else:
         print(f"Warning: Icon file not found at {ICON_PATH}, using default icon.")
 
+    engine.computer.set_table_engine(args.grundy_engine)
+    engine.computer.set_table_path(args.grundy_table)
     engine.logic.set_initial_piles(args.piles)
     engine.computer.set_cheat_mode(not args.no_cheat)
 
+    if args.profile_events:
+        atexit.register(write_event_profile, engine.events.enable_profiling(), args.profile_events)
+
     engine.scenes.register("menu", MenuScene)
     engine.scenes.register("play", PlayScene)
     engine.scenes.register("gameover", GameOverScene)
@@ -0,0 +1,175 @@
+"""
+Micro-benchmarks for the performance sensitive parts of the game.
+
+Usage: python -m grundy.benchmark [--limit N] [--repeat R]
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+import numpy as np
+
+from typing import Callable
+
+from grundy.core.computer import Computer, TABLE_ENGINES
+from grundy.core.parallel_table import default_workers
+from grundy.nodes.atoms.orbit import electron_bounds, electron_state_rows
+from grundy.nodes.atoms.utils import (
+    calculate_electrons_distribution,
+    ELECTRON_RADIUS,
+    ELECTRON_SPEED_FACTOR,
+    NUCLEUS_RADIUS,
+    ORBIT_FIRST_RADIUS_INCREMENT,
+    ORBIT_RADIUS_INCREMENT,
+)
+
+
+def _best_of(repeat: int, func: Callable[[], None]) -> float:
+    """
+    Run func several times and return the best wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_table_engines(limit: int, repeat: int) -> None:
+    """
+    Compare the Grundy table engines on a cold build up to limit.
+    """
+    print(f"Grundy table build up to {limit}:")
+
+    reference = None
+    for name in TABLE_ENGINES:
+        def build() -> None:
+            computer = Computer(None)
+            computer.set_table_engine(name)
+            computer.ensure_up_to(limit)
+
+        elapsed = _best_of(repeat, build)
+        print(f"  {name:<10} {elapsed * 1000:10.1f} ms", end="")
+        if reference is None:
+            reference = elapsed
+            print()
+        else:
+            print(f"  (x{reference / elapsed:.1f})")
+
+
+def bench_precompute(limit: int, repeat: int, workers: int) -> None:
+    """
+    Time a cold multi-process precompute up to limit.
+    """
+    def build() -> None:
+        Computer(None).precompute(limit, workers=workers)
+
+    elapsed = _best_of(repeat, build)
+    print(f"Parallel precompute up to {limit} with {workers} workers:")
+    print(f"  {'parallel':<10} {elapsed * 1000:10.1f} ms")
+
+
+def bench_single_value(limit: int, repeat: int) -> None:
+    """
+    Compare the cost of one Grundy value at size limit computed by XORing
+    iterators over the table, as the python engine does, against the set
+    comprehension it used to build.
+    """
+    computer = Computer(None)
+    computer.set_table_engine("numpy")
+    computer.ensure_up_to(limit)
+    cache = computer._g_cache
+    h = (limit - 1) // 2 + 1
+
+    def comprehension() -> int:
+        return Computer._mex({cache[i] ^ cache[limit - i] for i in range(1, h)})
+
+    def iterators() -> int:
+        computer.set_table_engine("python")
+        del cache[limit:]
+        computer._extend_python(limit)
+        return cache[limit]
+
+    print(f"Single Grundy value at size {limit}:")
+    for name, func in (("comprehension", comprehension), ("iterators", iterators)):
+        elapsed = _best_of(repeat * 20, func)
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"  {name:<14} {elapsed * 1e6:10.1f} us  {peak / 1024:8.1f} KiB peak")
+
+
+def _legacy_electron_bounds(radius: int, size: int, current_time: float) -> list:
+    """
+    Electron bounds as Orbit.update used to compute them, one cos/sin pair per electron.
+    """
+    bounds = []
+    speed_factor = ELECTRON_SPEED_FACTOR / radius
+    for i in range(size):
+        angle = 2 * math.pi * (i / size + current_time * speed_factor)
+        x = 400 + radius * math.cos(angle)
+        y = 300 + radius * math.sin(angle)
+        bounds.append((x - ELECTRON_RADIUS, y - ELECTRON_RADIUS, x + ELECTRON_RADIUS, y + ELECTRON_RADIUS))
+    return bounds
+
+
+def bench_orbits(pile_size: int, repeat: int) -> None:
+    """
+    Compare the per-electron trigonometry loop with the single vectorized pass
+    AtomsNode runs over the electrons of every orbit of an atom of the given size,
+    all of them drawn one by one, which rotates precomputed offsets with one
+    cos/sin pair per orbit. Canvas calls are not included.
+    """
+    orbits = [
+        (NUCLEUS_RADIUS + ORBIT_FIRST_RADIUS_INCREMENT + ORBIT_RADIUS_INCREMENT * index, count)
+        for index, count in enumerate(calculate_electrons_distribution(pile_size).electrons_per_layer)
+    ]
+    state = np.concatenate([
+        electron_state_rows(400, 300, radius, count, index) for index, (radius, count) in enumerate(orbits)
+    ])
+    speeds = np.array([ELECTRON_SPEED_FACTOR / radius for radius, _ in orbits])
+    frames = [frame * 0.032 for frame in range(100)]
+
+    def legacy() -> None:
+        for current_time in frames:
+            for radius, count in orbits:
+                _legacy_electron_bounds(radius, count, current_time)
+
+    def vectorized() -> None:
+        for current_time in frames:
+            electron_bounds(state, speeds, current_time).round(2).tolist()
+
+    reference_bounds = [bound for radius, count in orbits for bound in _legacy_electron_bounds(radius, count, 12.3)]
+    error = np.abs(np.array(reference_bounds) - electron_bounds(state, speeds, 12.3)).max()
+
+    print(f"Electron positions of a {pile_size} atom, {len(frames)} frames:")
+    reference = _best_of(repeat, legacy)
+    elapsed = _best_of(repeat, vectorized)
+    print(f"  {'loop':<10} {reference / len(frames) * 1e6:10.1f} us/frame")
+    print(f"  {'flat':<10} {elapsed / len(frames) * 1e6:10.1f} us/frame  (x{reference / elapsed:.1f}, max error {error:.1e} px)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Grundy's Game Benchmarks")
+    parser.add_argument("--limit", type=int, default=10000, help="largest pile size to compute (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, best one is kept (default: 3)")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="worker processes for precompute (default: CPU count)")
+    parser.add_argument("--pile", type=int, default=200, help="atom size for the animation benchmarks (default: 200)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    bench_table_engines(args.limit, args.repeat)
+    bench_single_value(args.limit, args.repeat)
+    bench_precompute(args.limit, args.repeat, args.workers)
+    bench_orbits(args.pile, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,106 @@
+import tkinter as tk
 import turtle
 
-from typing import Tuple, Literal
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Iterable, List, Set, Tuple, Literal, Union
 
 from grundy.utils.colors import parse_color, rgb_to_hex, lerp_color, ColorValue
+from grundy.utils.images import encode_ppm, encode_png, linear_gradient_strip, radial_gradient_disc
+
+# Tag carried by the hidden items waiting in a pool
+POOL_TAG = "pooled"
+
+GradientBackend = Literal["shapes", "image"]
+GRADIENT_BACKENDS = ("shapes", "image")
+# Number of rasterized images kept alive, images still displayed must stay cached
+MAX_CACHED_IMAGES = 64
+# Window sized gradients are heavy, only keep a few of them (one per background)
+MAX_CACHED_GRADIENTS = 4
+# Bands drawn by the 'shapes' gradient backend at full quality, and at the lowest
+GRADIENT_STEPS = 100
+MIN_GRADIENT_STEPS = 10
+
+
+class TkCallCounter:
+    """
+    Stands in for the Tcl interpreter of a widget and counts the commands sent through it.
+    """
+
+    def __init__(self, tk_app) -> None:
+        self._tk = tk_app
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def eval(self, script: str):
+        self.calls += 1
+        return self._tk.eval(script)
+
+    def __getattr__(self, name: str):
+        return getattr(self._tk, name)
+
+
+class CanvasItemPool:
+    """
+    Keeps released canvas items hidden for reuse instead of deleting them,
+    grouped by item type and pool name, so redraws do not churn Tk's item table.
+    """
+
+    def __init__(self, canvas: 'Canvas') -> None:
+        self._canvas = canvas
+        self._free: Dict[Tuple[str, str], List[int]] = {}
+        self._free_items: Set[int] = set()
+        self._in_use: Dict[int, Tuple[str, str]] = {}
+
+    def acquire(self, item_type: str, pool: str, *coords: float, tags: str = "", **options) -> int:
+        """
+        Get an item of the given type from a pool, creating it if the pool is empty.
+        A reused item is shown, moved, reconfigured and raised as if it was just created.
+        """
+        canvas = self._canvas
+        key = (item_type, pool)
+        free = self._free.get(key)
+
+        if free:
+            item = free.pop()
+            self._free_items.discard(item)
+            canvas.coords(item, *coords)
+            canvas.itemconfigure(item, **{"state": "normal", **options, "tags": tags})
+            canvas.tag_raise(item)
+        else:
+            item = getattr(canvas, f"create_{item_type}")(*coords, tags=tags, **options)
+
+        self._in_use[item] = key
+        return item
+
+    def release(self, tag_or_id: Union[str, int]) -> None:
+        """
+        Give back the pooled items matching a tag or id, deleting the other ones.
+        """
+        canvas = self._canvas
+        for item in canvas.find_withtag(tag_or_id):
+            key = self._in_use.pop(item, None)
+            if key is not None:
+                canvas.itemconfigure(item, state="hidden", tags=POOL_TAG)
+                self._free.setdefault(key, []).append(item)
+                self._free_items.add(item)
+            elif item not in self._free_items:
+                canvas.delete(item)
+
+    def forget_in_use(self) -> None:
+        """
+        Drop the items handed out, once the canvas deleted them.
+        """
+        self._in_use = {}
+
+    @property
+    def free_count(self) -> int:
+        """
+        Get the number of items waiting for reuse
+        """
+        return len(self._free_items)
 
 
 class Canvas(turtle.Canvas):
@@ -10,6 +108,88 @@ class Canvas(turtle.Canvas):
         super().__init__(master)
         self.pack(expand=True, fill='both')
 
+        self.pool = CanvasItemPool(self)
+
+        self._gradient_backend: GradientBackend = "image"
+        self._gradient_steps = GRADIENT_STEPS
+        self._images: OrderedDict[Hashable, tk.PhotoImage] = OrderedDict()
+        self._gradients: OrderedDict[Hashable, tk.PhotoImage] = OrderedDict()
+
+    def set_gradient_backend(self, name: GradientBackend) -> None:
+        """
+        Select how gradients are drawn:
+        'shapes' stacks one rectangle or circle per band,
+        'image' rasterizes the gradient once and shows it as a single image item.
+        """
+        if name not in GRADIENT_BACKENDS:
+            raise ValueError(f"Unknown gradient backend: {name}")
+        self._gradient_backend = name
+
+    @property
+    def gradient_backend(self) -> GradientBackend:
+        """
+        Get how gradients are drawn, see set_gradient_backend
+        """
+        return self._gradient_backend
+
+    def set_call_counting(self, enabled: bool) -> None:
+        """
+        Count the Tcl commands sent by the canvas, see tk_calls.
+        Counting goes through a Python wrapper, it is left off unless something reads it.
+        """
+        counting = isinstance(self.tk, TkCallCounter)
+        if enabled and not counting:
+            self.tk = TkCallCounter(self.tk)
+        elif not enabled and counting:
+            self.tk = self.tk._tk
+
+    @property
+    def tk_calls(self) -> int:
+        """
+        Get the number of Tcl commands sent since counting was enabled, a batch counting as one
+        """
+        return self.tk.calls if isinstance(self.tk, TkCallCounter) else 0
+
+    def set_gradient_quality(self, level: float) -> None:
+        """
+        Scale the number of bands of the 'shapes' gradient backend, level going from 0 to 1.
+        Gradients drawn afterwards use the new count.
+        """
+        self._gradient_steps = max(MIN_GRADIENT_STEPS, round(GRADIENT_STEPS * level))
+
+    def cached_image(self, key: Hashable, build: Callable[[], tk.PhotoImage]) -> tk.PhotoImage:
+        """
+        Get the image stored under key, calling build on a miss.
+        Least recently used images are dropped past MAX_CACHED_IMAGES.
+        """
+        return self._lookup_image(self._images, MAX_CACHED_IMAGES, key, build)
+
+    @staticmethod
+    def _lookup_image(
+            cache: OrderedDict,
+            capacity: int,
+            key: Hashable,
+            build: Callable[[], tk.PhotoImage]
+    ) -> tk.PhotoImage:
+        """
+        Least recently used lookup in an image cache.
+        """
+        image = cache.get(key)
+        if image is not None:
+            cache.move_to_end(key)
+            return image
+
+        image = cache[key] = build()
+        if len(cache) > capacity:
+            cache.popitem(last=False)
+        return image
+
+    def load_image(self, data: bytes, image_format: str) -> tk.PhotoImage:
+        """
+        Create an image owned by this canvas from encoded data.
+        """
+        return tk.PhotoImage(master=self, data=data, format=image_format)
+
     def create_gradient(
         self,
         start_color: ColorValue,
@@ -28,7 +208,13 @@ class Canvas(turtle.Canvas):
 
         width = bottom_right[0] - top_left[0]
         height = bottom_right[1] - top_left[1]
-        steps = 100
+        steps = self._gradient_steps
+
+        if self._gradient_backend == "image":
+            if width > 0 and height > 0:
+                image = self._gradient_image(start_rgb, end_rgb, width, height, direction)
+                self.create_image(top_left[0], top_left[1], image=image, anchor="nw", tags=tags)
+            return
 
         for i in range(steps):
             t = i / steps
@@ -54,7 +240,8 @@ class Canvas(turtle.Canvas):
             start_color: ColorValue,
             end_color: ColorValue,
             steps: int = 50,
-            tags: str = ""
+            tags: str = "",
+            pool: str = ""
     ) -> None:
         """
         Create a gradient circle (concentric circles with gradient).
@@ -64,6 +251,17 @@ class Canvas(turtle.Canvas):
         start_rgb = parse_color(start_color)
         end_rgb = parse_color(end_color)
 
+        if self._gradient_backend == "image":
+            image = self.cached_image(
+                ("circle", start_rgb, end_rgb, radius, steps),
+                lambda: self.load_image(encode_png(radial_gradient_disc(radius, start_rgb, end_rgb, steps)), "png")
+            )
+            if pool:
+                self.pool.acquire("image", pool, x, y, image=image, tags=tags)
+            else:
+                self.create_image(x, y, image=image, tags=tags)
+            return
+
         step_radius = radius // steps
 
         for i in range(steps):
@@ -72,7 +270,29 @@ class Canvas(turtle.Canvas):
             color = rgb_to_hex(current_rgb)
 
             current_radius = radius - (step_radius * i)
-            self.create_circle(x, y, current_radius, fill=color, outline="", tags=tags)
+            self.create_circle(x, y, current_radius, fill=color, outline="", tags=tags, pool=pool)
+
+    def _gradient_image(
+            self,
+            start_rgb: ColorValue,
+            end_rgb: ColorValue,
+            width: int,
+            height: int,
+            direction: Literal['horizontal', 'vertical']
+    ) -> tk.PhotoImage:
+        """
+        Get the image of a linear gradient of the given size.
+        Only a one pixel strip is encoded, Tk stretches it to the full size.
+        """
+        def build() -> tk.PhotoImage:
+            if direction == "horizontal":
+                strip = linear_gradient_strip(start_rgb, end_rgb, width, direction)
+                return self.load_image(encode_ppm(strip), "ppm").zoom(1, height)
+            strip = linear_gradient_strip(start_rgb, end_rgb, height, direction)
+            return self.load_image(encode_ppm(strip), "ppm").zoom(width, 1)
+
+        key = (start_rgb, end_rgb, width, height, direction)
+        return self._lookup_image(self._gradients, MAX_CACHED_GRADIENTS, key, build)
 
     def create_circle(
             self,
@@ -81,14 +301,18 @@ class Canvas(turtle.Canvas):
             radius: int,
             fill: ColorValue = "",
             outline: ColorValue = "",
-            tags: str = ""
+            tags: str = "",
+            pool: str = ""
     ) -> int:
         """
-        Create a circle on the canvas
+        Create a circle on the canvas, taken from the given item pool if any
         """
         color = "" if fill == "" else rgb_to_hex(parse_color(fill))
         outline = "" if outline == "" else rgb_to_hex(parse_color(outline))
-        return self.create_oval(x - radius, y - radius, x + radius, y + radius, fill=color, outline=outline, tags=tags)
+        coords = (x - radius, y - radius, x + radius, y + radius)
+        if pool:
+            return self.pool.acquire("oval", pool, *coords, fill=color, outline=outline, tags=tags)
+        return self.create_oval(*coords, fill=color, outline=outline, tags=tags)
 
     def create_trapeze(
             self,
@@ -125,8 +349,25 @@ class Canvas(turtle.Canvas):
             tags=tags
         )
 
+    @property
+    def path(self) -> str:
+        """
+        Get the Tcl command name of the canvas, used to build batched scripts
+        """
+        return self._w
+
+    def execute_batch(self, commands: Iterable[str]) -> None:
+        """
+        Run several canvas commands as a single Tcl script.
+        Saves one Python to Tcl round trip per command on hot paths.
+        """
+        script = "\n".join(commands)
+        if script:
+            self.tk.eval(script)
+
     def clear(self) -> None:
         """
-        Clear all drawings from the canvas
+        Clear all drawings from the canvas, pooled items are kept hidden for reuse
         """
-        self.delete("all")
\ No newline at end of file
+        self.delete(f"!{POOL_TAG}")
+        self.pool.forget_in_use()
\ No newline at end of file
@@ -1,17 +1,37 @@
 import random
-from typing import TYPE_CHECKING, Optional
+import numpy as np
+
+from itertools import islice
+from operator import xor
+from typing import TYPE_CHECKING, Optional, Literal
 
 from grundy.core.logic import Pile
+from grundy.core.parallel_table import extend_table_parallel, default_workers
+from grundy.core.table_store import GrundyTableStore
 
 if TYPE_CHECKING:
     from grundy.core.engine import Engine
 
+TableEngine = Literal["python", "numpy"]
+TABLE_ENGINES = ("python", "numpy")
+DEFAULT_TABLE_ENGINE: TableEngine = "python"
+
+# Sizes computed serially before precompute fans out to worker processes
+PARALLEL_BOOTSTRAP_SIZE = 2048
+
+
 class Computer:
     def __init__(self, engine: 'Engine'):
         self.engine = engine
 
-        self._g_cache: dict[int, int] = {0: 0, 1: 0}
+        # Grundy values indexed by pile size, always contiguous from 0
+        self._g_cache: list[int] = [0, 0]
+        # For each pile size, the Grundy value reached by a split -> its smallest position
+        self._split_index: dict[int, dict[int, int]] = {}
+        self._table_engine: TableEngine = DEFAULT_TABLE_ENGINE
+        self._table_store: Optional[GrundyTableStore] = None
         self._cheat_mode = False
+        self._verbose = True
 
     def set_cheat_mode(self, state: bool):
         self._cheat_mode = state
@@ -19,14 +39,37 @@ class Computer:
     def is_cheating(self) -> bool:
         return self._cheat_mode
 
+    def set_verbose(self, state: bool) -> None:
+        self._verbose = state
+
+    def _log(self, message: str) -> None:
+        if self._verbose:
+            print(message)
+
+    def set_table_engine(self, name: TableEngine) -> None:
+        """
+        Select the backend used to extend the Grundy table.
+        """
+        if name not in TABLE_ENGINES:
+            raise ValueError(f"Unknown table engine: {name}")
+        self._table_engine = name
+
+    def get_table_engine(self) -> TableEngine:
+        return self._table_engine
+
+    def set_table_path(self, path: Optional[str]) -> None:
+        """
+        Persist the Grundy table to the given file, or disable persistence with None.
+        Values already saved there are loaded lazily instead of being recomputed.
+        """
+        self._table_store = None if path is None else GrundyTableStore(path)
+
     def _compute_total_xor(self) -> int:
         """
-        Compute the XOR (nim-sum) of Grundy values for all piles
+        Get the XOR (nim-sum) of Grundy values for all piles,
+        as tracked incrementally by the game logic
         """
-        total_xor = 0
-        for pile in self.engine.logic.get_piles().values():
-            total_xor ^= self._pile_value(pile.size)
-        return total_xor
+        return self.engine.logic.get_nim_sum()
 
     def can_win(self) -> bool:
         """
@@ -39,48 +82,158 @@ class Computer:
         Think of a winning move based on the current game state.
         If no winning move is found, it will think randomly.
         """
+        pile_id, position = self.find_winning_move()
+        if pile_id is None or position is None:
+            return self.think_random()
+        return pile_id, position
+
+    def find_winning_move(self) -> tuple[Optional[int], Optional[int]]:
+        """
+        Find a move leaving a zero nim-sum.
+        Returns a tuple of (pile_id, position) or (None, None) if there is none.
+        """
         piles = self.engine.logic.get_piles().values()
         total_xor = self._compute_total_xor()
 
         if total_xor == 0:
-            print("No winning move (nim-sum=0), thinking randomly...")
-            return self.think_random()
+            self._log("No winning move (nim-sum=0)")
+            return None, None
 
         for pile in piles:
             if not pile.can_split():
                 continue
 
             pile_size = pile.size
-            g_before = self._pile_value(pile_size)
-            base = total_xor ^ g_before
-            max_i = (pile_size - 1) // 2
+            base = total_xor ^ self._pile_value(pile_size)
 
-            for i in range(1, max_i + 1):
-                j = pile_size - i
-                g_after = self._pile_value(i) ^ self._pile_value(j)
-                if base ^ g_after == 0:
-                    print(f"Winning move found: pile {pile.id}, split into {i} and {j}")
-                    return pile.id, i
+            i = self._split_positions(pile_size).get(base)
+            if i is not None:
+                self._log(f"Winning move found: pile {pile.id}, split into {i} and {pile_size - i}")
+                return pile.id, i
 
-        print("No winning move found after search, thinking randomly...")
-        return self.think_random()
+        self._log("No winning move found after search")
+        return None, None
+
+    def pile_value(self, n: int) -> int:
+        """
+        Get the Grundy value for a pile of size n.
+        """
+        return self._pile_value(n)
 
     def _pile_value(self, n: int) -> int:
         """
-        Compute the Grundy value for a pile of size n.
-        Uses memoization to cache results for efficiency.
+        Get the Grundy value for a pile of size n.
+        The table is extended on demand, see ensure_up_to.
+        """
+        if n >= len(self._g_cache):
+            self.ensure_up_to(n)
+        return self._g_cache[n]
+
+    def _split_positions(self, n: int) -> dict[int, int]:
+        """
+        Get the reverse index of a pile of size n, mapping the Grundy value
+        g(i) ^ g(n - i) of each split to the smallest position i reaching it.
+        Built once per size, so finding a winning split is a single lookup.
+        """
+        index = self._split_index.get(n)
+        if index is None:
+            self.ensure_up_to(n)
+            cache = self._g_cache
+            h = (n - 1) // 2 + 1
+
+            index = {}
+            for i, value in enumerate(map(xor, cache[1:h], cache[n - 1:n - h:-1]), 1):
+                index.setdefault(value, i)
+            self._split_index[n] = index
+        return index
+
+    def ensure_up_to(self, n: int) -> None:
+        """
+        Extend the Grundy table bottom-up so that it covers every size up to n.
+        Each size only depends on smaller ones, so no recursion is needed and
+        already computed values are never recomputed.
+        """
+        if n < len(self._g_cache) or self._load_from_store(n):
+            return
+
+        self._extend(n)
+        self._save_to_store()
+
+    def precompute(self, limit: int, workers: Optional[int] = None) -> None:
+        """
+        Fill the Grundy table up to limit using several worker processes.
+        Defaults to one worker per CPU, workers=1 computes in-process.
+        """
+        if limit < len(self._g_cache) or self._load_from_store(limit):
+            return
+
+        workers = workers or default_workers()
+        if workers > 1 and limit > PARALLEL_BOOTSTRAP_SIZE:
+            self._extend(PARALLEL_BOOTSTRAP_SIZE)
+            extend_table_parallel(self._g_cache, limit, workers)
+        else:
+            self._extend(limit)
+
+        self._save_to_store()
+
+    def _load_from_store(self, n: int) -> bool:
+        """
+        Extend the table with saved values, up to n.
+        Returns whether the table now covers n.
+        """
+        if self._table_store is not None:
+            self._g_cache.extend(self._table_store.read(len(self._g_cache), n + 1))
+        return n < len(self._g_cache)
+
+    def _save_to_store(self) -> None:
+        """
+        Save the table if persistence is enabled.
+        """
+        if self._table_store is not None:
+            self._table_store.save(self._g_cache)
+
+    def _extend(self, n: int) -> None:
+        """
+        Extend the table up to n with the selected engine.
+        """
+        if n < len(self._g_cache):
+            return
+
+        if self._table_engine == "numpy":
+            self._extend_numpy(n)
+        else:
+            self._extend_python(n)
+
+    def _extend_python(self, n: int) -> None:
+        """
+        Extend the Grundy table up to n in plain Python.
+        The values of the splits i + (size - i) are obtained by XORing the lower
+        half of the table against the reversed upper half.
+        """
+        cache = self._g_cache
+        for size in range(len(cache), n + 1):
+            h = (size - 1) // 2 + 1
+            # cache holds sizes 0 to size - 1, so its reversed view starts at size - 1
+            cache.append(self._mex(set(map(xor, islice(cache, 1, h), islice(reversed(cache), h - 1)))))
+
+    def _extend_numpy(self, n: int) -> None:
+        """
+        Extend the Grundy table up to n with vectorized NumPy passes.
+        For each size, the values of every split are obtained by XORing
+        the lower half of the table against the reversed upper half.
         """
-        if n in self._g_cache:
-            return self._g_cache[n]
+        start = len(self._g_cache)
+        g = np.empty(n + 1, dtype=np.int32)
+        g[:start] = self._g_cache
 
-        moves = {
-            self._pile_value(i) ^ self._pile_value(n - i)
-            for i in range(1, ((n - 1) // 2) + 1)
-        }
+        for size in range(start, n + 1):
+            h = (size - 1) // 2 + 1
+            moves = g[1:h] ^ g[size - 1:size - h:-1]
+            # The mex of k values is at most k, so the counts always hold a zero
+            counts = np.bincount(moves, minlength=h)
+            g[size] = np.argmin(counts != 0)
 
-        g = self._mex(moves)
-        self._g_cache[n] = g
-        return g
+        self._g_cache.extend(g[start:].tolist())
 
     @staticmethod
     def _mex(s: set[int]) -> int:
@@ -98,14 +251,14 @@ class Computer:
         Think of a random move when no winning move is found.
         Returns a tuple of (pile_id, position) or (None, None) if no valid move exists.
         """
-        print("Thinking randomly...")
+        self._log("Thinking randomly...")
         splittable = [
             p for p in self.engine.logic.get_piles().values()
             if p.can_split()
         ]
 
         if not splittable:
-            print("No splittable piles remain.")
+            self._log("No splittable piles remain.")
             return None, None
 
         pile = random.choice(splittable)
@@ -113,5 +266,5 @@ class Computer:
         position = random.randint(1, max_position)
 
         j = pile.size - position
-        print(f"Random move: pile {pile.id}, split into {position} and {j}")
+        self._log(f"Random move: pile {pile.id}, split into {position} and {j}")
         return pile.id, position
\ No newline at end of file
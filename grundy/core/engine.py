@@ -1,37 +1,101 @@
 import time
 
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
 from grundy.core.theme import ThemeProvider
 from grundy.core.canvas import Canvas
 from grundy.core.computer import Computer
 from grundy.core.events import Events, EventType
 from grundy.core.logic import Logic
+from grundy.core.quality import QualityGovernor
 from grundy.core.scene import SceneManager
+from grundy.core.scheduler import TkScheduler
 from grundy.core.viewport import Viewport
 
+DEFAULT_TARGET_FPS = 30
+# Consecutive frames optional UPDATE listeners may miss, they run at least this often under load
+MAX_SKIPPED_FRAMES = 3
+# Frames whose timings are kept for inspection, see frame_history
+FRAME_HISTORY_SIZE = 120
+
 
 class Engine:
     def __init__(self) -> None:
         self.theme = ThemeProvider()
         self.viewport = Viewport(self)
         self.canvas = Canvas(self.viewport)
+        self.scheduler = TkScheduler(self.canvas)
         self.events = Events()
         self.scenes = SceneManager(self)
         self.computer = Computer(self)
         self.logic = Logic(self)
+        self.quality = QualityGovernor(self)
 
         self.logic.reset()
+        self.events.subscribe(EventType.QUALITY_CHANGED, self._on_quality_changed)
 
         self._running = False
         self._last_frame_time: Optional[float] = None
 
+        self._frame_interval = 1 / DEFAULT_TARGET_FPS
+        self._next_frame_time = 0.0
+        self._frame_work_time = 0.0
+        self._skipped_frames = 0
+        self._skipped_time = 0.0
+        self._frame_count = 0
+        self._frame_history: Deque[Tuple[float, float]] = deque(maxlen=FRAME_HISTORY_SIZE)
+
+    def set_target_fps(self, fps: float) -> None:
+        """
+        Set the number of frames the engine aims to update per second
+        """
+        if fps <= 0:
+            raise ValueError(f"Target FPS must be positive (got {fps})")
+        self._frame_interval = 1 / fps
+
+    def get_target_fps(self) -> float:
+        """
+        Get the number of frames the engine aims to update per second
+        """
+        return 1 / self._frame_interval
+
+    @property
+    def frame_budget(self) -> float:
+        """
+        Time in seconds a frame may take without delaying the next one
+        """
+        return self._frame_interval
+
+    @property
+    def frame_work_time(self) -> float:
+        """
+        Time in seconds the last frame spent updating
+        """
+        return self._frame_work_time
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Number of frames updated since the engine started
+        """
+        return self._frame_count
+
+    @property
+    def frame_history(self) -> List[Tuple[float, float]]:
+        """
+        Time since the previous frame and time spent updating, in seconds,
+        of the last FRAME_HISTORY_SIZE frames, oldest first
+        """
+        return list(self._frame_history)
+
     def run(self) -> None:
         """
         Start the game engine
         """
         self._running = True
-        self._last_frame_time = time.time()
+        self._last_frame_time = time.perf_counter()
+        self._next_frame_time = self._last_frame_time
         self._update()
         self.viewport.mainloop()
 
@@ -44,15 +108,54 @@ class Engine:
 
     def _update(self) -> None:
         """
-        Main update loop
+        Main update loop.
+        Frames are scheduled at a fixed rate on a monotonic clock, the time spent
+        updating is taken from the delay until the next one. When the previous
+        frame went over budget, optional listeners are skipped and receive the
+        time they missed on the next frame they run.
         """
         if not self._running:
             return
 
-        current_time = time.time()
+        current_time = time.perf_counter()
         delta_time = current_time - (self._last_frame_time or current_time)
 
-        self.events.emit(EventType.UPDATE, current_time, delta_time)
+        self.events.emit_required(EventType.UPDATE, current_time, delta_time)
+
+        over_budget = self._frame_work_time > self._frame_interval
+        if over_budget and self._skipped_frames < MAX_SKIPPED_FRAMES:
+            self._skipped_frames += 1
+            self._skipped_time += delta_time
+        else:
+            self.events.emit_optional(EventType.UPDATE, current_time, delta_time + self._skipped_time)
+            self._skipped_frames = 0
+            self._skipped_time = 0.0
 
         self._last_frame_time = current_time
-        self.viewport.after(32, self._update)
+        self._schedule_next_frame(current_time)
+        self._frame_count += 1
+        self._frame_history.append((delta_time, self._frame_work_time))
+        self.quality.record_frame(delta_time, self._frame_work_time)
+
+    def _schedule_next_frame(self, frame_start: float) -> None:
+        """
+        Schedule the next frame on the fixed frame grid.
+        A frame running late does not try to catch up, the grid restarts from now.
+        """
+        now = time.perf_counter()
+        self._frame_work_time = now - frame_start
+
+        self._next_frame_time += self._frame_interval
+        if self._next_frame_time < now:
+            self._next_frame_time = now
+
+        delay_ms = round((self._next_frame_time - now) * 1000)
+        self.viewport.after(max(1, delay_ms), self._update)
+
+    def _on_quality_changed(self, level: float) -> None:
+        """
+        Scale the engine owned drawing work with the quality level.
+        Gradients drawn as images cost a single item whatever their band count.
+        """
+        if self.canvas.gradient_backend == "shapes":
+            self.canvas.set_gradient_quality(level)
@@ -1,11 +1,14 @@
 from enum import Enum, auto
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from grundy.core.profiling import EventProfiler
 
 
 class EventType(Enum):
     WINDOW_RESIZE = auto()
     UPDATE = auto()
     SCENE_CHANGED = auto()
+    QUALITY_CHANGED = auto()
 
     MOVE_MADE = auto()
     GAME_OVER = auto()
@@ -18,14 +21,34 @@ class EventType(Enum):
 class Events:
     def __init__(self) -> None:
         self._listeners: Dict[EventType, List[Callable]] = {}
+        self._optional: Dict[EventType, Set[Callable]] = {}
+        # Only set while profiling, the emit methods check it once per event
+        self.profiler: Optional[EventProfiler] = None
 
-    def subscribe(self, event_type: EventType, callback: Callable):
+    def enable_profiling(self) -> EventProfiler:
+        """
+        Start timing every listener call, keeping what was already recorded
         """
-        Subscribe to an event type with a callback function
+        if self.profiler is None:
+            self.profiler = EventProfiler()
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """
+        Stop timing listener calls and drop the recorded timings
+        """
+        self.profiler = None
+
+    def subscribe(self, event_type: EventType, callback: Callable, optional: bool = False):
+        """
+        Subscribe to an event type with a callback function.
+        Optional callbacks may be skipped by the emitter when it runs late, see emit_required.
         """
         if event_type not in self._listeners:
             self._listeners[event_type] = []
         self._listeners[event_type].append(callback)
+        if optional:
+            self._optional.setdefault(event_type, set()).add(callback)
 
     def unsubscribe(self, event_type: EventType, callback: Callable) -> None:
         """
@@ -33,11 +56,49 @@ class Events:
         """
         if event_type in self._listeners and callback in self._listeners[event_type]:
             self._listeners[event_type].remove(callback)
+            if callback not in self._listeners[event_type]:
+                self._optional.get(event_type, set()).discard(callback)
 
     def emit(self, event_type: EventType, *args, **kwargs) -> None:
         """
         Emit an event to all registered listeners
         """
         if event_type in self._listeners:
+            if self.profiler is not None:
+                self._emit_profiled(event_type, self._listeners[event_type], args, kwargs)
+                return
             for callback in self._listeners[event_type]:
                 callback(*args, **kwargs)
+
+    def emit_required(self, event_type: EventType, *args, **kwargs) -> None:
+        """
+        Emit an event to the listeners that were not subscribed as optional
+        """
+        optional = self._optional.get(event_type, ())
+        if self.profiler is not None:
+            required = [callback for callback in self._listeners.get(event_type, ()) if callback not in optional]
+            self._emit_profiled(event_type, required, args, kwargs)
+            return
+        for callback in self._listeners.get(event_type, ()):
+            if callback not in optional:
+                callback(*args, **kwargs)
+
+    def emit_optional(self, event_type: EventType, *args, **kwargs) -> None:
+        """
+        Emit an event to the listeners subscribed as optional
+        """
+        optional = self._optional.get(event_type, ())
+        if self.profiler is not None:
+            selected = [callback for callback in self._listeners.get(event_type, ()) if callback in optional]
+            self._emit_profiled(event_type, selected, args, kwargs)
+            return
+        for callback in self._listeners.get(event_type, ()):
+            if callback in optional:
+                callback(*args, **kwargs)
+
+    def _emit_profiled(self, event_type: EventType, callbacks: Iterable[Callable], args: tuple, kwargs: dict) -> None:
+        """
+        Call listeners through the profiler
+        """
+        for callback in callbacks:
+            self.profiler.call(event_type, callback, args, kwargs)
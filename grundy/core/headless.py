@@ -0,0 +1,52 @@
+"""
+Display-less engine running the game logic without Tk
+"""
+
+from typing import Callable, Optional, Tuple
+
+from grundy.core.computer import Computer
+from grundy.core.events import Events
+from grundy.core.logic import Logic
+from grundy.core.scheduler import Scheduler, ImmediateScheduler
+from grundy.core.theme import ThemeProvider
+
+Move = Tuple[Optional[int], Optional[int]]
+PlayerStrategy = Callable[['HeadlessEngine'], Move]
+
+
+class HeadlessEngine:
+    """
+    Engine exposing theme, events, computer and logic like Engine does,
+    without creating any window, so full games can be played synchronously.
+    """
+
+    def __init__(self, scheduler: Optional[Scheduler] = None) -> None:
+        self.theme = ThemeProvider()
+        self.scheduler = scheduler or ImmediateScheduler()
+        self.events = Events()
+        self.computer = Computer(self)
+        self.logic = Logic(self)
+
+        self.computer.set_verbose(False)
+
+    def play(self, player: PlayerStrategy) -> int:
+        """
+        Play a full game from a fresh reset, player choosing the moves
+        of player 1 while the computer plays player 2.
+        Returns the winner.
+        """
+        logic = self.logic
+        logic.reset()
+        self.scheduler.run_pending()
+
+        while not logic.is_game_over():
+            pile_id, position = player(self)
+            if pile_id is None or position is None:
+                raise ValueError("Player strategy returned no move while splittable piles remain")
+
+            if not logic.player_move(pile_id, position):
+                raise ValueError(f"Invalid move: pile {pile_id} at position {position}")
+
+            self.scheduler.run_pending()
+
+        return logic.last_winner
@@ -3,6 +3,7 @@ import random
 from typing import Dict, List, TYPE_CHECKING
 
 from grundy.core.events import EventType
+from grundy.core.state import GameState
 
 if TYPE_CHECKING:
     from grundy.core.engine import Engine
@@ -50,6 +51,10 @@ class Logic:
     _initial_piles: List[int]
     piles: Dict[int, Pile]
 
+    # Aggregates kept in sync with piles, see _add_pile and _remove_pile
+    _nim_sum: int
+    _splittable_count: int
+
     current_player: int
     last_winner: int
 
@@ -59,6 +64,10 @@ class Logic:
         self._initial_piles = []
         self.last_winner = 0
 
+        self.piles = {}
+        self._nim_sum = 0
+        self._splittable_count = 0
+
     def set_initial_piles(self, values: List[int]):
         """
         Set multiple initial piles.
@@ -69,6 +78,57 @@ class Logic:
     def get_piles(self) -> Dict[int, Pile]:
         return self.piles
 
+    def get_state(self) -> GameState:
+        """
+        Get the canonical state of the current position.
+        """
+        return GameState.from_logic(self)
+
+    def set_state(self, state: GameState) -> None:
+        """
+        Replace the piles with the ones of a state, keeping the current player.
+        """
+        self.piles = {}
+        self._nim_sum = 0
+        self._splittable_count = 0
+
+        for size in state:
+            kind = random.randint(0, self.engine.theme.size - 1)
+            self._add_pile(Pile(size, kind))
+
+        self.engine.events.emit(EventType.GAME_RESET)
+
+    def get_nim_sum(self) -> int:
+        """
+        Get the XOR of the Grundy values of all piles.
+        """
+        return self._nim_sum
+
+    def get_splittable_count(self) -> int:
+        """
+        Get the number of piles that can still be split.
+        """
+        return self._splittable_count
+
+    def _add_pile(self, pile: Pile) -> None:
+        """
+        Add a pile and account for it in the aggregates.
+        """
+        self.piles[pile.id] = pile
+        self._nim_sum ^= self.engine.computer.pile_value(pile.size)
+        if pile.can_split():
+            self._splittable_count += 1
+
+    def _remove_pile(self, pile_id: int) -> Pile:
+        """
+        Remove a pile and withdraw it from the aggregates.
+        """
+        pile = self.piles.pop(pile_id)
+        self._nim_sum ^= self.engine.computer.pile_value(pile.size)
+        if pile.can_split():
+            self._splittable_count -= 1
+        return pile
+
     def _random_reset(self):
         """
         Performs a reset with random piles.
@@ -77,7 +137,7 @@ class Logic:
         for _ in range(num_piles):
             kind = random.randint(0, self.engine.theme.size - 1)
             pile = Pile(random.randint(RANDOM_RESET_MIN_SIZE, RANDOM_RESET_MAX_SIZE), kind)
-            self.piles[pile.id] = pile
+            self._add_pile(pile)
 
     def _custom_reset(self):
         """
@@ -86,13 +146,16 @@ class Logic:
         for size in self._initial_piles:
             kind = random.randint(0, self.engine.theme.size - 1)
             pile = Pile(size, kind)
-            self.piles[pile.id] = pile
+            self._add_pile(pile)
 
     def reset(self):
         """
         Reset the game.
         """
+        self.last_winner = 0
         self.piles = {}
+        self._nim_sum = 0
+        self._splittable_count = 0
 
         if self._initial_piles:
             self._custom_reset()
@@ -120,16 +183,15 @@ class Logic:
         if not self._is_valid_move(pile_id, position):
             return False
 
-        pile = self.piles[pile_id]
+        pile = self._remove_pile(pile_id)
         new_size1 = position
         new_size2 = pile.size - position
 
-        del self.piles[pile_id]
         new_pile1 = Pile(new_size1, pile.kind)
         new_pile2 = Pile(new_size2, pile.kind)
 
-        self.piles[new_pile1.id] = new_pile1
-        self.piles[new_pile2.id] = new_pile2
+        self._add_pile(new_pile1)
+        self._add_pile(new_pile2)
 
         self.engine.events.emit(EventType.PILE_REMOVED, pile_id)
         self.engine.events.emit(EventType.PILE_ADDED, new_pile1)
@@ -143,17 +205,19 @@ class Logic:
         self._switch_player()
         return True
 
-    def player_move(self, pile_id: int, position: int):
+    def player_move(self, pile_id: int, position: int) -> bool:
         """
         Handle the player's move.
         :param pile_id: The index of the pile to split.
         :param position: The position to split the pile.
+        :return: Whether the move was made.
         """
         if not self.is_player_turn():
-            return
+            return False
 
-        self._make_move(pile_id, position)
+        made = self._make_move(pile_id, position)
         self.computer_move()
+        return made
 
     def computer_move(self) -> None:
         """
@@ -166,7 +230,7 @@ class Logic:
         if pile_id is None or position is None:
             return
 
-        self.engine.canvas.after(
+        self.engine.scheduler.after(
             400, self._make_move,
             pile_id, position
         )
@@ -201,7 +265,7 @@ class Logic:
         Check if the game is over.
         :return: Whether the game is over.
         """
-        return not any(pile.can_split() for pile in self.piles.values())
+        return self._splittable_count == 0
 
     def is_player_turn(self) -> bool:
         """
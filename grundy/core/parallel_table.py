@@ -0,0 +1,160 @@
+"""
+Multi-process extension of the Grundy table.
+
+Once g(0..k-1) is known, every split of a size n in [k, k + b) whose two
+parts are both below k can be evaluated independently. Workers fill these
+partial move sets block by block through shared memory, and the remaining
+splits, which involve freshly computed values, are stitched in sequentially.
+"""
+
+import os
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+# Largest number of sizes handled per block, it bounds the shared move matrix
+MAX_BLOCK_SIZE = 16384
+
+_worker_table: Optional[np.ndarray] = None
+_worker_memory: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _init_worker(table_name: str, table_size: int) -> None:
+    """
+    Attach a worker process to the shared Grundy table.
+    """
+    global _worker_table
+    memory = shared_memory.SharedMemory(name=table_name)
+    _worker_memory["table"] = memory
+    _worker_table = np.ndarray((table_size,), dtype=np.int32, buffer=memory.buf)
+
+
+def _fill_known_moves(
+    seen_name: str,
+    seen_shape: tuple[int, int],
+    block_start: int,
+    start: int,
+    stop: int,
+    known: int
+) -> None:
+    """
+    Mark the values reachable from sizes start..stop-1 using only splits
+    whose parts are both below known.
+    """
+    memory = shared_memory.SharedMemory(name=seen_name)
+    try:
+        seen = np.ndarray(seen_shape, dtype=np.bool_, buffer=memory.buf)
+        g = _worker_table
+        for n in range(start, stop):
+            # Splits i + (n - i) with n - i < known, i.e. i > n - known
+            low = n - known + 1
+            high = (n - 1) // 2
+            if low > high:
+                continue
+            moves = g[low:high + 1] ^ g[n - low:n - high - 1:-1]
+            seen[n - block_start, moves] = True
+        del seen
+    finally:
+        memory.close()
+
+
+def _stitch(g: np.ndarray, seen: np.ndarray, block_start: int, stop: int, known: int) -> None:
+    """
+    Complete the move sets of a block with the splits involving new values
+    and compute the mex of each size in order.
+    """
+    width = seen.shape[1]
+    for n in range(block_start, stop):
+        row = seen[n - block_start]
+        count = min((n - 1) // 2, n - known)
+        if count > 0:
+            moves = g[1:count + 1] ^ g[n - 1:n - count - 1:-1]
+            row[moves[moves < width]] = True
+            overflow = moves[moves >= width]
+        else:
+            overflow = np.empty(0, dtype=np.int32)
+
+        free = np.flatnonzero(~row)
+        if free.size:
+            g[n] = free[0]
+        else:
+            mex = width
+            extra = set(overflow.tolist())
+            while mex in extra:
+                mex += 1
+            g[n] = mex
+
+
+def extend_table_parallel(table: List[int], limit: int, workers: int) -> None:
+    """
+    Extend table in place so that it covers every size up to limit.
+    """
+    start = len(table)
+    if limit < start:
+        return
+
+    table_memory = shared_memory.SharedMemory(create=True, size=(limit + 1) * 4)
+    try:
+        g = np.ndarray((limit + 1,), dtype=np.int32, buffer=table_memory.buf)
+        g[:start] = table
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(table_memory.name, limit + 1)
+        ) as executor:
+            known = start
+            while known <= limit:
+                stop = min(limit + 1, known + max(1, min(known // 4, MAX_BLOCK_SIZE)))
+                _compute_block(executor, workers, g, known, stop)
+                known = stop
+
+        table.extend(g[start:].tolist())
+        del g
+    finally:
+        table_memory.close()
+        table_memory.unlink()
+
+
+def _compute_block(
+    executor: ProcessPoolExecutor,
+    workers: int,
+    g: np.ndarray,
+    known: int,
+    stop: int
+) -> None:
+    """
+    Compute the Grundy values of sizes known..stop-1.
+    """
+    # XOR of values below a power of two stays below it
+    width = 1 << int(g[:known].max()).bit_length()
+    shape = (stop - known, max(width, 1))
+
+    seen_memory = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+    try:
+        seen = np.ndarray(shape, dtype=np.bool_, buffer=seen_memory.buf)
+        seen[:] = False
+
+        chunk = -(-shape[0] // workers)
+        futures = [
+            executor.submit(
+                _fill_known_moves,
+                seen_memory.name, shape, known,
+                chunk_start, min(stop, chunk_start + chunk), known
+            )
+            for chunk_start in range(known, stop, chunk)
+        ]
+        for future in futures:
+            future.result()
+
+        _stitch(g, seen, known, stop, known)
+        del seen
+    finally:
+        seen_memory.close()
+        seen_memory.unlink()
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
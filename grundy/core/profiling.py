@@ -0,0 +1,122 @@
+"""
+Per listener timing of emitted events, enabled on demand with Events.enable_profiling.
+"""
+
+import json
+import time
+
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Literal, Optional, TextIO, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grundy.core.events import EventType
+
+ProfileFormat = Literal["table", "json"]
+PROFILE_FORMATS = ("table", "json")
+
+
+@dataclass
+class ListenerStats:
+    """
+    Timing of one listener of one event type, durations in nanoseconds.
+    """
+    event: str
+    listener: str
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+def listener_name(callback: Callable) -> str:
+    """
+    Get a readable name for a listener, such as 'ParticlesNode._on_update'.
+    """
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class EventProfiler:
+    """
+    Records how many times each listener was called and how long it took.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple['EventType', Callable], ListenerStats] = {}
+
+    def call(self, event_type: 'EventType', callback: Callable, args: tuple, kwargs: dict) -> None:
+        """
+        Call a listener, recording its duration.
+        """
+        start = time.perf_counter_ns()
+        try:
+            callback(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+
+            stats = self._stats.get((event_type, callback))
+            if stats is None:
+                stats = self._stats[(event_type, callback)] = ListenerStats(event_type.name, listener_name(callback))
+            stats.calls += 1
+            stats.total_ns += elapsed
+            if elapsed > stats.max_ns:
+                stats.max_ns = elapsed
+
+    def get_stats(self, event_type: Optional['EventType'] = None) -> List[ListenerStats]:
+        """
+        Get the recorded listeners, optionally of a single event type, the most expensive first.
+        """
+        stats = [
+            entry for (recorded_type, _), entry in self._stats.items()
+            if event_type is None or recorded_type == event_type
+        ]
+        return sorted(stats, key=lambda entry: entry.total_ns, reverse=True)
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded so far.
+        """
+        self._stats.clear()
+
+    def dump(self, file: TextIO, fmt: ProfileFormat = "table") -> None:
+        """
+        Write the recorded listeners as JSON or as a text table.
+        """
+        stats = self.get_stats()
+        if fmt == "json":
+            json.dump(
+                [{**asdict(entry), "mean_ns": round(entry.mean_ns)} for entry in stats],
+                file,
+                indent=2
+            )
+            file.write("\n")
+            return
+
+        if fmt != "table":
+            raise ValueError(f"Unknown profile format: {fmt}. Available: {', '.join(PROFILE_FORMATS)}")
+
+        headers = ("event", "listener", "calls", "total ms", "mean us", "max us")
+        rows = [
+            (
+                entry.event,
+                entry.listener,
+                str(entry.calls),
+                f"{entry.total_ns / 1e6:.1f}",
+                f"{entry.mean_ns / 1e3:.1f}",
+                f"{entry.max_ns / 1e3:.1f}"
+            )
+            for entry in stats
+        ]
+        widths = [max(len(row[i]) for row in (headers, *rows)) for i in range(len(headers))]
+
+        def format_row(row: Tuple[str, ...]) -> str:
+            # Names are left aligned, numbers right aligned
+            cells = [cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(row, widths))]
+            return "  ".join(cells).rstrip()
+
+        file.write(format_row(headers) + "\n")
+        file.write("  ".join("-" * width for width in widths) + "\n")
+        for row in rows:
+            file.write(format_row(row) + "\n")
@@ -0,0 +1,99 @@
+"""
+Adaptive quality, lowers the visual load of nodes when frames run late and raises it back when there is headroom.
+"""
+
+from collections import deque
+from typing import Deque, Iterable, TYPE_CHECKING
+
+from grundy.core.events import EventType
+
+if TYPE_CHECKING:
+    from grundy.core.engine import Engine
+
+MIN_QUALITY = 0.25
+QUALITY_STEP = 0.25
+# Frames measured before each decision, and after each change before the next one
+FRAME_WINDOW = 60
+# Percentile of the window compared with the frame budget
+FRAME_PERCENTILE = 0.9
+# Frame period, relative to the budget, above which quality is lowered
+DOWNSCALE_RATIO = 1.2
+# Frame period and update time, relative to the budget, below which quality is raised
+UPSCALE_PERIOD_RATIO = 1.05
+UPSCALE_WORK_RATIO = 0.5
+
+
+def percentile(samples: Iterable[float], fraction: float) -> float:
+    """
+    Get the value below which the given fraction of the samples fall.
+    """
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+class QualityGovernor:
+    """
+    Watches the frame times measured by the engine and moves a quality level
+    between MIN_QUALITY and 1, one QUALITY_STEP at a time.
+    Nodes scale their work with the level they receive through QUALITY_CHANGED.
+
+    The frame period tells when frames run late, including the time Tk spends
+    drawing, while the update time tells how much headroom is left.
+    """
+
+    def __init__(self, engine: 'Engine') -> None:
+        self.engine = engine
+        self._enabled = True
+        self._level = 1.0
+        self._periods: Deque[float] = deque(maxlen=FRAME_WINDOW)
+        self._work_times: Deque[float] = deque(maxlen=FRAME_WINDOW)
+
+    @property
+    def level(self) -> float:
+        """
+        Get the current quality level, 1 being full quality
+        """
+        return self._level
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable adaptation, disabling restores full quality
+        """
+        self._enabled = enabled
+        if not enabled:
+            self.set_level(1.0)
+
+    def set_level(self, level: float) -> None:
+        """
+        Set the quality level and notify the nodes if it changed
+        """
+        level = min(1.0, max(MIN_QUALITY, level))
+        self._periods.clear()
+        self._work_times.clear()
+        if level == self._level:
+            return
+
+        self._level = level
+        self.engine.events.emit(EventType.QUALITY_CHANGED, level)
+
+    def record_frame(self, period: float, work_time: float) -> None:
+        """
+        Record the time since the previous frame and the time spent updating,
+        adjusting the quality level once a full window has been measured.
+        """
+        if not self._enabled:
+            return
+
+        self._periods.append(period)
+        self._work_times.append(work_time)
+        if len(self._periods) < FRAME_WINDOW:
+            return
+
+        budget = self.engine.frame_budget
+        period = percentile(self._periods, FRAME_PERCENTILE)
+        work_time = percentile(self._work_times, FRAME_PERCENTILE)
+
+        if period > budget * DOWNSCALE_RATIO and self._level > MIN_QUALITY:
+            self.set_level(self._level - QUALITY_STEP)
+        elif period < budget * UPSCALE_PERIOD_RATIO and work_time < budget * UPSCALE_WORK_RATIO and self._level < 1.0:
+            self.set_level(self._level + QUALITY_STEP)
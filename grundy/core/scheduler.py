@@ -0,0 +1,83 @@
+"""
+Schedulers used to run delayed callbacks, such as the computer's move.
+"""
+
+import heapq
+import itertools
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, List, Tuple
+
+
+class Scheduler(ABC):
+    @abstractmethod
+    def after(self, delay_ms: int, callback: Callable, *args: Any) -> None:
+        """
+        Run callback with args once delay_ms milliseconds have elapsed
+        """
+        pass
+
+    def run_pending(self) -> None:
+        """
+        Run every callback still waiting, if the scheduler holds any
+        """
+        pass
+
+
+class TkScheduler(Scheduler):
+    """
+    Delegates to the Tk event loop of a widget.
+    """
+
+    def __init__(self, widget) -> None:
+        self._widget = widget
+
+    def after(self, delay_ms: int, callback: Callable, *args: Any) -> None:
+        self._widget.after(delay_ms, callback, *args)
+
+
+class ImmediateScheduler(Scheduler):
+    """
+    Runs callbacks right away, ignoring the delay.
+    """
+
+    def after(self, delay_ms: int, callback: Callable, *args: Any) -> None:
+        callback(*args)
+
+
+class VirtualClockScheduler(Scheduler):
+    """
+    Keeps callbacks on a simulated clock that only moves when advanced.
+    """
+
+    def __init__(self) -> None:
+        self._now_ms = 0
+        self._counter = itertools.count()
+        self._queue: List[Tuple[int, int, Callable, Tuple[Any, ...]]] = []
+
+    @property
+    def now_ms(self) -> int:
+        """
+        Get the current virtual time in milliseconds
+        """
+        return self._now_ms
+
+    def after(self, delay_ms: int, callback: Callable, *args: Any) -> None:
+        heapq.heappush(self._queue, (self._now_ms + delay_ms, next(self._counter), callback, args))
+
+    def advance(self, delay_ms: int) -> None:
+        """
+        Move the clock forward, running callbacks that become due in order
+        """
+        target = self._now_ms + delay_ms
+        while self._queue and self._queue[0][0] <= target:
+            due, _, callback, args = heapq.heappop(self._queue)
+            self._now_ms = due
+            callback(*args)
+        self._now_ms = target
+
+    def run_pending(self) -> None:
+        while self._queue:
+            due, _, callback, args = heapq.heappop(self._queue)
+            self._now_ms = max(self._now_ms, due)
+            callback(*args)
@@ -0,0 +1,68 @@
+"""
+Canonical, hashable representation of a game position
+"""
+
+from typing import Iterable, Iterator, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grundy.core.logic import Logic
+
+
+class GameState:
+    """
+    A position reduced to the sorted sizes of its splittable piles.
+    Piles of 1 and 2 can never be split again, so they are dropped and
+    equivalent positions compare and hash equal.
+    """
+    __slots__ = ("_sizes", "_hash")
+
+    def __init__(self, sizes: Iterable[int] = ()) -> None:
+        self._sizes: Tuple[int, ...] = tuple(sorted(size for size in sizes if size > 2))
+        self._hash = hash(self._sizes)
+
+    @classmethod
+    def from_logic(cls, logic: 'Logic') -> 'GameState':
+        """
+        Build the state of the piles currently in play.
+        """
+        return cls(pile.size for pile in logic.get_piles().values())
+
+    @property
+    def sizes(self) -> Tuple[int, ...]:
+        return self._sizes
+
+    def is_terminal(self) -> bool:
+        """
+        Check if no move is left.
+        """
+        return not self._sizes
+
+    def children(self) -> Iterator[Tuple[int, int, 'GameState']]:
+        """
+        Yield every move as (pile size, position, resulting state).
+        Piles of equal size lead to the same states, so each size is split once.
+        """
+        sizes = self._sizes
+        for index, size in enumerate(sizes):
+            if index > 0 and size == sizes[index - 1]:
+                continue
+            rest = sizes[:index] + sizes[index + 1:]
+            for position in range(1, (size - 1) // 2 + 1):
+                yield size, position, GameState(rest + (position, size - position))
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._sizes)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self._hash == other._hash and self._sizes == other._sizes
+
+    def __repr__(self) -> str:
+        return f"GameState{self._sizes}"
@@ -0,0 +1,105 @@
+"""
+Persistent storage for the Grundy table.
+
+The file holds a small header followed by the raw Grundy values:
+    magic (4 bytes) | version (u16) | itemsize (u16) | count (u64) | values
+Values are stored little-endian as uint16, or uint32 if they ever outgrow it.
+"""
+
+import os
+import struct
+import numpy as np
+
+from typing import Optional, Sequence, List
+
+MAGIC = b"GRDY"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+DTYPES = {2: np.dtype("<u2"), 4: np.dtype("<u4")}
+
+
+class GrundyTableStore:
+    """
+    Grundy table saved on disk and loaded lazily through a read-only memory map,
+    so several processes reading the same file share its pages.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._values: Optional[np.ndarray] = None
+        self._loaded = False
+
+    def __len__(self) -> int:
+        values = self._map()
+        return 0 if values is None else len(values)
+
+    def read(self, start: int, stop: int) -> List[int]:
+        """
+        Read the Grundy values of sizes start (inclusive) to stop (exclusive).
+        """
+        values = self._map()
+        if values is None:
+            return []
+        return values[start:stop].tolist()
+
+    def save(self, values: Sequence[int]) -> None:
+        """
+        Write the whole table to disk, warning instead of failing if it cannot be written.
+        The file is replaced atomically, readers keep their current mapping.
+        """
+        array = np.asarray(values)
+        itemsize = 2 if array.size == 0 or array.max() <= np.iinfo(np.uint16).max else 4
+
+        # Release our own mapping first, some platforms refuse to replace a mapped file
+        self._values = None
+        self._loaded = False
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                file.write(HEADER.pack(MAGIC, FORMAT_VERSION, itemsize, array.size))
+                file.write(array.astype(DTYPES[itemsize]).tobytes())
+            os.replace(tmp_path, self.path)
+        except OSError as error:
+            # Saving is only a cache, the game goes on with the table in memory
+            print(f"Warning: Could not save Grundy table to {self.path} ({error})")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _map(self) -> Optional[np.ndarray]:
+        """
+        Map the file into memory on first access.
+        Returns None if the file is missing or not a valid table.
+        """
+        if self._loaded:
+            return self._values
+        self._loaded = True
+
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(HEADER.size)
+        except OSError:
+            return None
+
+        if len(header) != HEADER.size:
+            print(f"Warning: Ignoring truncated Grundy table at {self.path}")
+            return None
+
+        magic, version, itemsize, count = HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION or itemsize not in DTYPES:
+            print(f"Warning: Ignoring incompatible Grundy table at {self.path}")
+            return None
+
+        expected_size = HEADER.size + count * itemsize
+        if count == 0 or os.path.getsize(self.path) < expected_size:
+            return None
+
+        self._values = np.memmap(
+            self.path,
+            dtype=DTYPES[itemsize],
+            mode="r",
+            offset=HEADER.size,
+            shape=(count,)
+        )
+        return self._values
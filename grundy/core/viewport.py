@@ -1,9 +1,15 @@
+import time
 import turtle
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 from grundy.core.events import EventType
 
+# Delay without new size after which a burst of resizes is emitted
+RESIZE_SETTLE_MS = 40
+# Longest a resize may be held back while the size keeps changing
+RESIZE_MAX_LATENCY_MS = 200
+
 
 class Viewport(turtle._Root):
     def __init__(self, engine):
@@ -13,15 +19,44 @@ class Viewport(turtle._Root):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._running = True
 
+        self._resize_settle_ms = RESIZE_SETTLE_MS
+        self._resize_max_latency_ms = RESIZE_MAX_LATENCY_MS
+        self._pending_size: Optional[Tuple[int, int]] = None
+        self._pending_since = 0.0
+        self._pending_after_id: Optional[str] = None
+
+        # Window size kept up to date by <Configure>, see get_size
+        self._size: Optional[Tuple[int, int]] = None
+
         self._setup_on_resize_event()
 
+    def set_resize_coalescing(self, settle_ms: int, max_latency_ms: int = RESIZE_MAX_LATENCY_MS) -> None:
+        """
+        Configure how bursts of resizes are collapsed into a single WINDOW_RESIZE event.
+        The event is emitted once the size did not change for settle_ms, or at the
+        latest max_latency_ms after the burst started. A settle_ms of 0 emits every resize.
+        """
+        self._resize_settle_ms = settle_ms
+        self._resize_max_latency_ms = max_latency_ms
+
     def get_size(self) -> Tuple[int, int]:
         """
-        Get the current window size
+        Get the current window size.
+        The size is cached and refreshed on every <Configure> of the window.
+        """
+        if self._size is None:
+            return self.refresh_size()
+        return self._size
+
+    def refresh_size(self) -> Tuple[int, int]:
+        """
+        Force a synchronization of the cached size with the window.
+        Only needed before the window processed its pending geometry changes.
         """
         # Processes pending events to ensure an accurate size
         self.update_idletasks()
-        return self.winfo_width(), self.winfo_height()
+        self._size = (self.winfo_width(), self.winfo_height())
+        return self._size
 
     def get_center(self) -> Tuple[int, int]:
         """
@@ -56,9 +91,45 @@ class Viewport(turtle._Root):
             width = event.width
             height = event.height
 
+            # Children events bubble up to this binding, only the window defines the size
+            if event.widget is self:
+                self._size = (width, height)
+
             if width != prev_width or height != prev_height:
                 prev_width = width
                 prev_height = height
-                self.engine.events.emit(EventType.WINDOW_RESIZE, width, height)
+                self._queue_resize(width, height)
+
+        self.bind("<Configure>", _handle)
+
+    def _queue_resize(self, width: int, height: int) -> None:
+        """
+        Emit a resize now, or hold it back until the size settles
+        """
+        if self._resize_settle_ms <= 0:
+            self.engine.events.emit(EventType.WINDOW_RESIZE, width, height)
+            return
+
+        now = time.perf_counter()
+        if self._pending_size is None:
+            self._pending_since = now
+        self._pending_size = (width, height)
+
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+
+        elapsed_ms = (now - self._pending_since) * 1000
+        delay_ms = min(self._resize_settle_ms, max(0, int(self._resize_max_latency_ms - elapsed_ms)))
+        self._pending_after_id = self.after(delay_ms, self._flush_resize)
+
+    def _flush_resize(self) -> None:
+        """
+        Emit the last size of a burst of resizes
+        """
+        self._pending_after_id = None
+        if self._pending_size is None:
+            return
 
-        self.bind("<Configure>", _handle)
\ No newline at end of file
+        width, height = self._pending_size
+        self._pending_size = None
+        self.engine.events.emit(EventType.WINDOW_RESIZE, width, height)
@@ -2,16 +2,25 @@
 Atom simulation node for visualizing and interacting with atomic structures.
 """
 
+import numpy as np
+
 from typing import List, Optional
 from dataclasses import dataclass
 
 from grundy.core.events import EventType
 from grundy.core.node import Node
 from grundy.core.logic import Pile
-from grundy.nodes.atoms.atom import Atom
-from grundy.nodes.atoms.utils import place_single_atom, pick_atom_at, calculate_electrons_distribution, Bounds, NUCLEUS_RADIUS
+from grundy.nodes.atoms.atom import Atom, AtomConfig
+from grundy.nodes.atoms.orbit import Orbit, OrbitConfig, electron_bounds, RING_MODE_THRESHOLD
+from grundy.nodes.atoms.utils import place_single_atom, pick_atom_at, calculate_electrons_distribution, AtomGrid, Bounds, NUCLEUS_RADIUS
 from grundy.nodes.atoms.warning import AtomWarning
 
+# Nucleus gradient steps drawn at the lowest quality, with the 'shapes' gradient backend
+MIN_NUCLEUS_GRADIENT_STEPS = 3
+# Ring rotation steps and electron count from which orbits are drawn as a ring, at the lowest quality
+MIN_RING_FRAMES = 4
+MIN_RING_THRESHOLD = 8
+
 
 @dataclass
 class NodeConfig:
@@ -38,18 +47,33 @@ class AtomsNode(Node):
         self.config = NodeConfig()
 
         self._atoms: List[Atom] = []
+        # Spatial index of _atoms, kept in sync for placement and picking
+        self._grid = AtomGrid()
         self._selected_atom: Optional[Atom] = None
         self._viewport_bounds = self._calculate_viewport_bounds()
         self._split_text_id: Optional[int] = None
 
         self._warning = AtomWarning(self.engine)
 
+        # Flat state of every electron, rebuilt when atoms change, see _rebuild_electron_state
+        self._electron_state = np.empty((0, 5), dtype=np.float64)
+        self._orbit_speeds = np.empty(0, dtype=np.float64)
+        self._electron_ids: List[int] = []
+        self._ring_orbits: List[Orbit] = []
+        self._electron_state_dirty = False
+
+        # Scaled with the quality level, electrons move every _electron_frame_skip frames
+        self._atom_config = AtomConfig()
+        self._electron_frame_skip = 1
+        self._electron_frame = 0
+
     def on_activated(self) -> None:
         """
         Set up event handlers when node is activated.
         """
         self._subscribe_to_events()
         self._bind_mouse_events()
+        self._apply_quality(self.engine.quality.level)
         self._setup_atoms()
 
     def on_deactivated(self) -> None:
@@ -64,9 +88,11 @@ class AtomsNode(Node):
         """
         Add a new atom to the visualization.
         """
-        atom = Atom(self.engine, x, y, pile)
+        atom = Atom(self.engine, x, y, pile, self._atom_config)
         atom.draw()
         self._atoms.append(atom)
+        self._grid.add(atom)
+        self._electron_state_dirty = True
 
     def get_atom_by_id(self, pile_id: int) -> Optional[Atom]:
         """
@@ -84,6 +110,7 @@ class AtomsNode(Node):
         events.subscribe(EventType.GAME_RESET, self._on_game_reset)
         events.subscribe(EventType.PILE_ADDED, self._on_pile_added)
         events.subscribe(EventType.PILE_REMOVED, self._on_pile_removed)
+        events.subscribe(EventType.QUALITY_CHANGED, self._on_quality_changed)
 
     def _unsubscribe_from_events(self) -> None:
         """
@@ -95,6 +122,7 @@ class AtomsNode(Node):
         events.unsubscribe(EventType.GAME_RESET, self._on_game_reset)
         events.unsubscribe(EventType.PILE_ADDED, self._on_pile_added)
         events.unsubscribe(EventType.PILE_REMOVED, self._on_pile_removed)
+        events.unsubscribe(EventType.QUALITY_CHANGED, self._on_quality_changed)
 
     def _bind_mouse_events(self) -> None:
         """
@@ -122,6 +150,8 @@ class AtomsNode(Node):
         for atom in self._atoms:
             atom.clear()
         self._atoms.clear()
+        self._grid.clear()
+        self._electron_state_dirty = True
 
     def _setup_atoms(self) -> None:
         """
@@ -137,7 +167,7 @@ class AtomsNode(Node):
             distribution = calculate_electrons_distribution(pile.size)
             success, x, y = place_single_atom(
                 self._viewport_bounds,
-                self._atoms,
+                self._grid,
                 distribution.layer_count
             )
 
@@ -192,7 +222,7 @@ class AtomsNode(Node):
         """
         Handle mouse click events.
         """
-        self._selected_atom = pick_atom_at(self._atoms, event.x, event.y)
+        self._selected_atom = pick_atom_at(self._grid, event.x, event.y)
         if self._selected_atom:
             self._create_split_text()
 
@@ -260,12 +290,55 @@ class AtomsNode(Node):
         self._setup_atoms()
         self._warning.render()
 
+    def _rebuild_electron_state(self) -> None:
+        """
+        Gather the electrons of every orbit of every atom in a single array.
+        Orbits drawn as a ring image have no electron items and are updated on their own.
+        """
+        states, speeds, ids = [], [], []
+        self._ring_orbits = []
+        for atom in self._atoms:
+            for orbit in atom.orbits:
+                if orbit.is_ring:
+                    self._ring_orbits.append(orbit)
+                    continue
+                state, electron_ids = orbit.electron_state(len(speeds))
+                states.append(state)
+                speeds.append(orbit.speed)
+                ids.extend(electron_ids)
+
+        self._electron_state = np.concatenate(states) if states else np.empty((0, 5), dtype=np.float64)
+        self._orbit_speeds = np.array(speeds, dtype=np.float64)
+        self._electron_ids = ids
+        self._electron_state_dirty = False
+
     def _on_update(self, current_time: float, delta_time: float) -> None:
         """
         Update all atoms' animations.
+        Every electron is positioned in one vectorized pass and moved with one Tk script.
         """
-        for atom in self._atoms:
-            atom.update(current_time, delta_time)
+        self._electron_frame = (self._electron_frame + 1) % self._electron_frame_skip
+        if self._electron_frame:
+            return
+
+        if self._electron_state_dirty:
+            self._rebuild_electron_state()
+
+        for orbit in self._ring_orbits:
+            orbit.update(current_time, delta_time)
+
+        state = self._electron_state
+        if not len(state):
+            return
+
+        bounds = electron_bounds(state, self._orbit_speeds, current_time).round(2).tolist()
+
+        canvas = self.engine.canvas
+        path = canvas.path
+        canvas.execute_batch(
+            f"{path} coords {electron_id} {x1} {y1} {x2} {y2}"
+            for electron_id, (x1, y1, x2, y2) in zip(self._electron_ids, bounds)
+        )
 
     def _on_game_reset(self) -> None:
         """
@@ -280,7 +353,7 @@ class AtomsNode(Node):
         distribution = calculate_electrons_distribution(pile.size)
         success, x, y = place_single_atom(
             self._viewport_bounds,
-            self._atoms,
+            self._grid,
             distribution.layer_count
         )
 
@@ -296,4 +369,43 @@ class AtomsNode(Node):
         atom = self.get_atom_by_id(pile_id)
         if atom:
             atom.clear()
-            self._atoms.remove(atom)
\ No newline at end of file
+            self._atoms.remove(atom)
+            self._grid.remove(atom)
+            self._electron_state_dirty = True
+
+    def _apply_quality(self, level: float) -> None:
+        """
+        Scale the electron animation rate and the orbits drawn as ring images,
+        fewer electrons being moved one by one at lower quality.
+        The nucleus gradient is scaled too when drawn as shapes, an image gradient
+        being a single item whatever its band count.
+        """
+        steps = AtomConfig.nucleus_gradient_steps
+        if self.engine.canvas.gradient_backend == "shapes":
+            steps = max(MIN_NUCLEUS_GRADIENT_STEPS, round(steps * level))
+
+        self._atom_config = AtomConfig(
+            nucleus_gradient_steps=steps,
+            orbit_config=OrbitConfig(
+                ring_threshold=max(MIN_RING_THRESHOLD, round(RING_MODE_THRESHOLD * level)),
+                ring_frames=max(MIN_RING_FRAMES, round(OrbitConfig.ring_frames * level))
+            )
+        )
+        self._electron_frame_skip = max(1, round(1 / level))
+
+    def _redraw_atoms(self) -> None:
+        """
+        Draw the atoms again in place, with the current atom configuration.
+        """
+        for atom in self._atoms:
+            atom.clear()
+            atom.config = self._atom_config
+            atom.draw()
+        self._electron_state_dirty = True
+
+    def _on_quality_changed(self, level: float) -> None:
+        """
+        Handle quality changes, every atom is redrawn so they all look the same.
+        """
+        self._apply_quality(level)
+        self._redraw_atoms()
@@ -1,12 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
 from grundy.core.logic import Pile
-from grundy.nodes.atoms.orbit import Orbit
+from grundy.nodes.atoms.orbit import Orbit, OrbitConfig
 from grundy.nodes.atoms.utils import (
     calculate_electrons_distribution,
     calculate_real_radius,
     NUCLEUS_RADIUS,
+    ATOM_ITEM_POOL,
     ORBIT_FIRST_RADIUS_INCREMENT,
     ORBIT_RADIUS_INCREMENT,
 )
@@ -23,6 +24,7 @@ class AtomConfig:
     font_family: str = "Arial"
     font_size: int = 10
     font_color: str = "red"
+    orbit_config: OrbitConfig = field(default_factory=OrbitConfig)
 
 
 class Atom:
@@ -68,26 +70,23 @@ class Atom:
         """
         for orbit in self._orbits:
             orbit.clear()
-        self.engine.canvas.delete(self._tag)
+        self._orbits.clear()
+        self.engine.canvas.pool.release(self._tag)
 
-    def update(self, current_time: float, delta_time: float) -> None:
+    @property
+    def orbits(self) -> List[Orbit]:
         """
-        Update the atom's electron positions.
-
-        Args:
-            current_time: Current simulation time
-            delta_time: Time elapsed since last update
+        Get the electron orbits of the atom.
         """
-        for orbit in self._orbits:
-            orbit.update(current_time, delta_time)
+        return self._orbits
 
     def _draw_nucleus(self) -> None:
         """
         Draw the atom's nucleus with gradient and size label.
+        The gradient is a cached image shared by every nucleus, the label a text item on top.
         """
         canvas = self.engine.canvas
 
-        # Draw nucleus with gradient
         canvas.create_gradient_circle(
             self.x,
             self.y,
@@ -95,11 +94,12 @@ class Atom:
             start_color=self.config.nucleus_outer_color,
             end_color=self.config.nucleus_inner_color,
             steps=self.config.nucleus_gradient_steps,
-            tags=self._tag
+            tags=self._tag,
+            pool=ATOM_ITEM_POOL
         )
 
-        # Draw size label
-        canvas.create_text(
+        canvas.pool.acquire(
+            "text", ATOM_ITEM_POOL,
             self.x,
             self.y,
             text=str(self.pile.size),
@@ -124,7 +124,8 @@ class Atom:
                 self.y,
                 radius,
                 electron_count,
-                self.pile
+                self.pile,
+                self.config.orbit_config
             )
             orbit.draw()
             self._orbits.append(orbit)
\ No newline at end of file
@@ -1,10 +1,64 @@
 import math
+import numpy as np
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Literal, Optional, Tuple
 
 from grundy.core.logic import Pile
-from grundy.nodes.atoms.utils import ELECTRON_RADIUS, ELECTRON_SPEED_FACTOR
+from grundy.nodes.atoms.sprites import RingSpriteCache
+from grundy.nodes.atoms.utils import ELECTRON_RADIUS, ELECTRON_SPEED_FACTOR, ATOM_ITEM_POOL
+
+OrbitRenderMode = Literal["electrons", "ring", "auto"]
+ORBIT_RENDER_MODES = ("electrons", "ring", "auto")
+
+# Electron count from which the 'auto' render mode draws the orbit as a ring image
+RING_MODE_THRESHOLD = 32
+
+RING_SPRITES = RingSpriteCache()
+
+
+def electron_state_rows(nucleus_x: float, nucleus_y: float, radius: float, count: int, orbit: int = 0) -> np.ndarray:
+    """
+    Describe count evenly spaced electrons of an orbit for a vectorized update.
+    The resting offsets are computed once, electron_bounds only rotates them.
+
+    Returns:
+        Array of (nucleus x, nucleus y, x offset, y offset, orbit index) rows,
+        one per electron, the offsets being the electron position at time 0
+    """
+    angle = 2 * np.pi * np.arange(count) / count
+    state = np.empty((count, 5), dtype=np.float64)
+    state[:, 0] = nucleus_x
+    state[:, 1] = nucleus_y
+    state[:, 2] = radius * np.cos(angle)
+    state[:, 3] = radius * np.sin(angle)
+    state[:, 4] = orbit
+    return state
+
+
+def electron_bounds(state: np.ndarray, speeds: np.ndarray, current_time: float) -> np.ndarray:
+    """
+    Calculate the bounding box of every electron described by state at the given time,
+    state holding rows as built by electron_state_rows and speeds the speed of each
+    orbit, in turns per second, by orbit index.
+    A single cos/sin pair is computed per orbit and applied to all of its electrons.
+
+    Returns:
+        Array of (left, top, right, bottom) rows, one per electron
+    """
+    angle = 2 * np.pi * ((current_time * speeds) % 1)
+    orbits = state[:, 4].astype(np.intp)
+    cos = np.cos(angle)[orbits]
+    sin = np.sin(angle)[orbits]
+    dx, dy = state[:, 2], state[:, 3]
+    x = state[:, 0] + dx * cos - dy * sin
+    y = state[:, 1] + dx * sin + dy * cos
+    return np.column_stack((
+        x - ELECTRON_RADIUS,
+        y - ELECTRON_RADIUS,
+        x + ELECTRON_RADIUS,
+        y + ELECTRON_RADIUS
+    ))
 
 
 @dataclass
@@ -14,6 +68,9 @@ class OrbitConfig:
     """
     orbit_color: str = "black"
     electron_outline: str = "black"
+    render_mode: OrbitRenderMode = "auto"
+    ring_threshold: int = RING_MODE_THRESHOLD  # Electron count from which 'auto' draws a ring
+    ring_frames: int = 16  # Rotation steps rendered between two electron positions
 
 
 class Orbit:
@@ -45,32 +102,64 @@ class Orbit:
         self.pile: Pile = pile
 
         self._electrons: List[int] = []
+        self._ring_id: Optional[int] = None
+        self._ring_frames: list = []
+        self._ring_frame = -1
 
     def update(self, current_time: float, delta_time: float) -> None:
         """
-        Update electron positions in the orbit.
+        Show the ring image of the current rotation step, for orbits drawn as a ring.
+        Electrons drawn one by one are moved by AtomsNode, see electron_state.
 
         Args:
             current_time: Current simulation time
             delta_time: Time elapsed since last update
         """
-        canvas = self.engine.canvas
-        # Speed factor is inversely proportional to the orbit radius. It
-        # decreases as the radius increase.
-        speed_factor = ELECTRON_SPEED_FACTOR / self.radius
+        if self._ring_id is None:
+            return
 
-        for i, electron_id in enumerate(self._electrons):
-            spatial_offset = i / self.size
-            temporal_offset = current_time * speed_factor
-            normalized_angle = spatial_offset + temporal_offset
+        frame = self.ring_frame(current_time)
+        if frame != self._ring_frame:
+            self._ring_frame = frame
+            self.engine.canvas.itemconfigure(self._ring_id, image=self._ring_frames[frame])
 
-            angle = 2 * math.pi * normalized_angle
-            
-            x = self.nucleus_x + self.radius * math.cos(angle)
-            y = self.nucleus_y + self.radius * math.sin(angle)
+    @property
+    def speed(self) -> float:
+        """
+        Rotation speed of the electrons, in turns per second.
+        Speed factor is inversely proportional to the orbit radius. It
+        decreases as the radius increase.
+        """
+        return ELECTRON_SPEED_FACTOR / self.radius
+
+    @property
+    def is_ring(self) -> bool:
+        """
+        Whether the electrons are drawn as a single rotating ring image.
+        """
+        mode = self.config.render_mode
+        return mode == "ring" or (mode == "auto" and self.size >= self.config.ring_threshold)
 
-            bounds = self._calculate_electron_bounds(x, y)
-            canvas.coords(electron_id, *bounds)
+    def ring_frame(self, current_time: float) -> int:
+        """
+        Index of the ring image showing the electrons at the given time.
+        Electrons are evenly spaced, so the ring looks the same every 1 / size turn.
+        """
+        turns = (current_time * self.speed * self.size) % 1
+        return int(turns * len(self._ring_frames)) % len(self._ring_frames)
+
+    def electron_state(self, orbit: int) -> Tuple[np.ndarray, List[int]]:
+        """
+        Describe the drawn electrons for a vectorized update.
+
+        Args:
+            orbit: Index of the orbit speed in the array given to electron_bounds
+
+        Returns:
+            The electron_state_rows of the drawn electrons and their item ids
+        """
+        state = electron_state_rows(self.nucleus_x, self.nucleus_y, self.radius, self.size, orbit)
+        return state[:len(self._electrons)], list(self._electrons)
 
     def draw(self) -> None:
         """
@@ -83,7 +172,10 @@ class Orbit:
         """
         Remove all visual elements of the orbit.
         """
-        self.engine.canvas.delete(self._tag)
+        self.engine.canvas.pool.release(self._tag)
+        self._electrons.clear()
+        self._ring_id = None
+        self._ring_frames = []
 
     def _draw_orbit_path(self) -> None:
         """
@@ -94,7 +186,8 @@ class Orbit:
             self.nucleus_y,
             self.radius,
             outline=self.config.orbit_color,
-            tags=self._tag
+            tags=self._tag,
+            pool=ATOM_ITEM_POOL
         )
 
     def _draw_electrons(self) -> None:
@@ -103,6 +196,27 @@ class Orbit:
         """
         canvas = self.engine.canvas
 
+        if self.is_ring:
+            self._ring_frames = RING_SPRITES.get(
+                canvas,
+                self.radius,
+                self.size,
+                ELECTRON_RADIUS,
+                self.engine.theme.current[self.pile.kind],
+                self.config.electron_outline,
+                self.config.ring_frames
+            )
+            self._ring_frame = 0
+            self._ring_id = canvas.pool.acquire(
+                "image",
+                ATOM_ITEM_POOL,
+                self.nucleus_x,
+                self.nucleus_y,
+                image=self._ring_frames[0],
+                tags=self._tag
+            )
+            return
+
         for i in range(self.size):
             angle = 2 * math.pi * i / self.size
             x = self.nucleus_x + self.radius * math.cos(angle)
@@ -114,25 +228,7 @@ class Orbit:
                 ELECTRON_RADIUS,
                 fill=self.engine.theme.current[self.pile.kind],
                 outline=self.config.electron_outline,
-                tags=self._tag
+                tags=self._tag,
+                pool=ATOM_ITEM_POOL
             )
             self._electrons.append(electron_id)
-
-    @staticmethod
-    def _calculate_electron_bounds(x: float, y: float) -> tuple[float, float, float, float]:
-        """
-        Calculate the bounding box for an electron at given coordinates.
-
-        Args:
-            x: Center x-coordinate
-            y: Center y-coordinate
-
-        Returns:
-            Tuple of (left, top, right, bottom) coordinates
-        """
-        return (
-            x - ELECTRON_RADIUS,
-            y - ELECTRON_RADIUS,
-            x + ELECTRON_RADIUS,
-            y + ELECTRON_RADIUS
-        )
\ No newline at end of file
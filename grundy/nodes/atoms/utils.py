@@ -2,12 +2,13 @@
 Utility functions and constants for atom visualization.
 """
 
+import math
 import random
 
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, List, Tuple, Optional, TYPE_CHECKING
 
-from grundy.utils.geom import Point, Bounds
+from grundy.utils.geom import Bounds
 
 if TYPE_CHECKING:
     from grundy.nodes.atoms.atom import Atom
@@ -22,6 +23,11 @@ ORBIT_FIRST_RADIUS_INCREMENT = 10
 ORBIT_RADIUS_INCREMENT = 10
 ATOM_MIN_DISTANCE = 6
 MAX_PLACEMENT_ATTEMPTS = 300
+# Side of the cells of the AtomGrid, about the diameter of a small atom
+GRID_CELL_SIZE = 64
+
+# Canvas item pool shared by all atoms, see CanvasItemPool
+ATOM_ITEM_POOL = "atoms"
 
 
 @dataclass
@@ -65,46 +71,125 @@ def atoms_overlap(atom1: 'Atom', x: int, y: int, radius: float) -> bool:
     """
     Check if two atoms would overlap at given positions.
     """
-    point1 = Point(atom1.x, atom1.y)
-    point2 = Point(x, y)
-    min_distance = calculate_real_radius(atom1.distribution.layer_count) + radius + ATOM_MIN_DISTANCE
+    min_distance = atom1.real_radius + radius + ATOM_MIN_DISTANCE
+    dx, dy = atom1.x - x, atom1.y - y
+
+    return dx * dx + dy * dy < min_distance * min_distance
 
-    return point1.distance_to(point2) < min_distance
+
+class AtomGrid:
+    """
+    Uniform grid spatial index of the atoms on screen.
+
+    Each atom is listed in every cell its electron layers reach, so an atom
+    close to a point is always listed in the cells around that point and
+    queries only look at the atoms of a few neighbouring cells.
+    """
+
+    def __init__(self, cell_size: int = GRID_CELL_SIZE) -> None:
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List['Atom']] = {}
+        self._atom_cells: Dict[int, List[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._atom_cells)
+
+    def add(self, atom: 'Atom') -> None:
+        """
+        Index an atom at its current position.
+        """
+        keys = list(self._cells_around(atom.x, atom.y, atom.real_radius))
+        for key in keys:
+            self._cells.setdefault(key, []).append(atom)
+        self._atom_cells[id(atom)] = keys
+
+    def remove(self, atom: 'Atom') -> None:
+        """
+        Remove an atom from the index, if it was indexed.
+        """
+        for key in self._atom_cells.pop(id(atom), ()):
+            cell = self._cells[key]
+            cell.remove(atom)
+            if not cell:
+                del self._cells[key]
+
+    def clear(self) -> None:
+        """
+        Remove every atom from the index.
+        """
+        self._cells.clear()
+        self._atom_cells.clear()
+
+    def nearby(self, x: float, y: float, reach: float) -> Iterator['Atom']:
+        """
+        Iterate once over each atom listed in the cells within reach of a point,
+        which includes every atom whose layers come within reach of it.
+        """
+        seen = set()
+        for key in self._cells_around(x, y, reach):
+            for atom in self._cells.get(key, ()):
+                if id(atom) not in seen:
+                    seen.add(id(atom))
+                    yield atom
+
+    def overlaps(self, x: int, y: int, radius: float) -> bool:
+        """
+        Check if an atom of the given radius would overlap an indexed atom.
+        """
+        return any(
+            atoms_overlap(atom, x, y, radius)
+            for atom in self.nearby(x, y, radius + ATOM_MIN_DISTANCE)
+        )
+
+    def pick(self, x: int, y: int) -> Optional['Atom']:
+        """
+        Find the first indexed atom whose nucleus contains a point.
+        """
+        key = (math.floor(x / self._cell_size), math.floor(y / self._cell_size))
+        for atom in self._cells.get(key, ()):
+            dx, dy = atom.x - x, atom.y - y
+            if dx * dx + dy * dy <= NUCLEUS_RADIUS * NUCLEUS_RADIUS:
+                return atom
+
+        return None
+
+    def _cells_around(self, x: float, y: float, reach: float) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the keys of the cells intersecting a square centered on a point.
+        """
+        size = self._cell_size
+        column_start, column_end = math.floor((x - reach) / size), math.floor((x + reach) / size)
+        row_start, row_end = math.floor((y - reach) / size), math.floor((y + reach) / size)
+        for column in range(column_start, column_end + 1):
+            for row in range(row_start, row_end + 1):
+                yield column, row
 
 
 def place_single_atom(
     area_bounds: Bounds,
-    existing_atoms: List,
+    grid: AtomGrid,
     layer_count: int,
 ) -> Tuple[bool, int, int]:
     """
-    Try to place a single atom within a rectangular area.
+    Try to place a single atom within a rectangular area, clear of the atoms in the grid.
     Returns a tuple of (success, x, y) where success is True if placement was successful
     """
     if area_bounds.x2 <= area_bounds.x1 or area_bounds.y2 <= area_bounds.y1:
         return False, 0, 0
 
+    radius = calculate_real_radius(layer_count)
     for _ in range(MAX_PLACEMENT_ATTEMPTS):
         x = random.randint(area_bounds.x1, area_bounds.x2)
         y = random.randint(area_bounds.y1, area_bounds.y2)
 
-        if not any(
-            atoms_overlap(atom, x, y, calculate_real_radius(layer_count))
-            for atom in existing_atoms
-        ):
+        if not grid.overlaps(x, y, radius):
             return True, x, y
 
     return False, 0, 0
 
 
-def pick_atom_at(atoms: List, x: int, y: int) -> Optional['Atom']:
+def pick_atom_at(grid: AtomGrid, x: int, y: int) -> Optional['Atom']:
     """
     Find an atom at the given coordinates.
     """
-    point = Point(x, y)
-
-    for atom in atoms:
-        if point.distance_to(Point(atom.x, atom.y)) <= NUCLEUS_RADIUS:
-            return atom
-
-    return None
\ No newline at end of file
+    return grid.pick(x, y)
\ No newline at end of file
@@ -12,6 +12,14 @@ MAX_SPEED = 1.5
 MIN_RADIUS = 0.5
 MAX_RADIUS = 1
 INTENSITY_THRESHOLD = 0.12
+# Number of gray levels particles are drawn with, fewer levels means fewer updates
+INTENSITY_LEVELS = 32
+
+# Fill color of each quantized intensity level
+GRAY_LEVELS = [
+    rgb_to_hex((value, value, value))
+    for value in (level * 255 // (INTENSITY_LEVELS - 1) for level in range(INTENSITY_LEVELS))
+]
 
 
 class ParticlesNode(Node):
@@ -26,34 +34,95 @@ class ParticlesNode(Node):
         super().__init__(engine)
         self._tag = f"id-{id(self)}"
         self._density = density
+        self._quality = engine.quality.level
 
         # Particle state array [x, y, speed, radius, intensity]
         self._particles: Optional[np.ndarray] = None
-        self._ovals: List[int] = [] 
+        self._ovals: List[int] = []
+        # Last rendered state of each particle, to only send what changed to Tk
+        self._visible: Optional[np.ndarray] = None
+        self._rendered_levels: Optional[np.ndarray] = None
+        self._rendered_positions: Optional[np.ndarray] = None
 
     def _initialize_particles(self) -> None:
         """
-        Initialize or reinitialize the particle system
+        Initialize or reinitialize the particle system.
+        Existing ovals are kept, only the difference is taken from or given back to the canvas pool.
         """
-        self.engine.canvas.delete(self._tag)
+        width, height = self.engine.viewport.get_size()
+        num_particles = self._particle_count()
+
+        self._particles = self._random_particles(num_particles, width, height)
+        self._visible = np.zeros(num_particles, dtype=bool)
+        self._rendered_levels = np.full(num_particles, -1, dtype=np.int16)
+        self._rendered_positions = np.full((num_particles, 2), -1, dtype=np.int32)
+
+        # Match the canvas ovals to the particle count, all of them starting hidden
+        self.engine.canvas.itemconfigure(self._tag, state="hidden")
+        self._match_ovals(num_particles)
 
+    def _resize_particles(self) -> None:
+        """
+        Match the particle count to the density, keeping the particles already on screen
+        and only adding or removing the difference.
+        """
+        if self._particles is None:
+            return
+
+        width, height = self.engine.viewport.get_size()
+        num_particles = self._particle_count()
+        extra = num_particles - len(self._particles)
+
+        if extra <= 0:
+            self._particles = self._particles[:num_particles]
+            self._visible = self._visible[:num_particles]
+            self._rendered_levels = self._rendered_levels[:num_particles]
+            self._rendered_positions = self._rendered_positions[:num_particles]
+        else:
+            self._particles = np.vstack((self._particles, self._random_particles(extra, width, height)))
+            self._visible = np.concatenate((self._visible, np.zeros(extra, dtype=bool)))
+            self._rendered_levels = np.concatenate((self._rendered_levels, np.full(extra, -1, dtype=np.int16)))
+            self._rendered_positions = np.vstack((self._rendered_positions, np.full((extra, 2), -1, dtype=np.int32)))
+
+        self._match_ovals(num_particles)
+
+    def _particle_count(self) -> int:
+        """
+        Get the number of particles filling the viewport at the current density and quality.
+        """
         width, height = self.engine.viewport.get_size()
-        num_particles = int(self._density * width * height)
+        return int(self._density * self._quality * width * height)
 
-        # Create particle state array
-        self._particles = np.zeros((num_particles, 5), dtype=np.float32)
+    @staticmethod
+    def _random_particles(count: int, width: int, height: int) -> np.ndarray:
+        """
+        Create the state of count particles at random positions.
+        """
+        particles = np.zeros((count, 5), dtype=np.float32)
+        particles[:, 0] = np.random.uniform(0, width, count)  # x
+        particles[:, 1] = np.random.uniform(0, height, count)  # y
+        particles[:, 2] = np.random.uniform(MIN_SPEED, MAX_SPEED, count)  # speed
+        particles[:, 3] = np.random.uniform(MIN_RADIUS, MAX_RADIUS, count)  # radius
+        particles[:, 4] = 0  # intensity
+        return particles
+
+    def _match_ovals(self, count: int) -> None:
+        """
+        Give back or take hidden ovals from the canvas pool until there is one per particle.
+        Ovals taken while others are on screen are moved under them, acquiring an item
+        raises it above everything drawn after the particles.
+        """
+        canvas = self.engine.canvas
 
-        # Initialize random positions
-        self._particles[:, 0] = np.random.uniform(0, width, num_particles)  # x
-        self._particles[:, 1] = np.random.uniform(0, height, num_particles)  # y
-        self._particles[:, 2] = np.random.uniform(MIN_SPEED, MAX_SPEED, num_particles)  # speed
-        self._particles[:, 3] = np.random.uniform(MIN_RADIUS, MAX_RADIUS, num_particles)  # radius
-        self._particles[:, 4] = 0  # intensity
+        for oval_id in self._ovals[count:]:
+            canvas.pool.release(oval_id)
+        del self._ovals[count:]
 
-        # Create canvas ovals for each particle
-        self._ovals = []
-        for _ in range(num_particles):
-            oval_id = self.engine.canvas.create_oval(
+        anchor = self._ovals[0] if self._ovals else None
+        added = []
+        for _ in range(len(self._ovals), count):
+            oval_id = canvas.pool.acquire(
+                "oval", self._tag,
                 0, 0, 0, 0,
                 fill="",
                 outline="",
@@ -61,14 +130,22 @@ class ParticlesNode(Node):
                 tags=self._tag
             )
             self._ovals.append(oval_id)
+            added.append(oval_id)
+
+        if anchor is not None:
+            path = canvas.path
+            canvas.execute_batch(f"{path} lower {oval_id} {anchor}" for oval_id in added)
 
     def on_activated(self) -> None:
         """
         Handle node activation
         """
         self.engine.events.subscribe(EventType.WINDOW_RESIZE, self._on_resize)
-        self.engine.events.subscribe(EventType.UPDATE, self._on_update)
+        # Decorative, the engine may skip it on frames running late
+        self.engine.events.subscribe(EventType.UPDATE, self._on_update, optional=True)
+        self.engine.events.subscribe(EventType.QUALITY_CHANGED, self._on_quality_changed)
 
+        self._quality = self.engine.quality.level
         self._initialize_particles()
 
     def on_deactivated(self) -> None:
@@ -77,11 +154,15 @@ class ParticlesNode(Node):
         """
         self.engine.events.unsubscribe(EventType.WINDOW_RESIZE, self._on_resize)
         self.engine.events.unsubscribe(EventType.UPDATE, self._on_update)
+        self.engine.events.unsubscribe(EventType.QUALITY_CHANGED, self._on_quality_changed)
 
-        self.engine.canvas.delete(self._tag)
+        self.engine.canvas.pool.release(self._tag)
 
         self._ovals = []
         self._particles = None
+        self._visible = None
+        self._rendered_levels = None
+        self._rendered_positions = None
 
     def _on_update(self, ct: float, dt: float) -> None:
         """
@@ -108,34 +189,56 @@ class ParticlesNode(Node):
 
     def _render(self) -> None:
         """
-        Render all particles
+        Render all particles.
+        Particles are drawn at whole pixel positions with quantized gray levels,
+        only those whose visibility, position or level changed since the last
+        render are updated, and the updates are sent to Tk as a single script.
         """
-        if self._particles is None:
+        if self._particles is None or self._visible is None:
             return
 
         canvas = self.engine.canvas
-        for i, (x, y, _, radius, intensity) in enumerate(self._particles):
-            if intensity < INTENSITY_THRESHOLD:
-                canvas.itemconfig(self._ovals[i], state="hidden")
-                continue
-
-            # Calculate oval coordinates
-            x1, y1 = x - radius, y - radius
-            x2, y2 = x + radius, y + radius
-
-            scaled_intensity = int(intensity * 255)
-            color = rgb_to_hex((scaled_intensity, scaled_intensity, scaled_intensity))
-
-            # Update oval position and appearance
-            canvas.coords(self._ovals[i], x1, y1, x2, y2)
-            canvas.itemconfig(
-                self._ovals[i],
-                state="normal",
-                fill=color
-            )
+        path = canvas.path
+        ovals = self._ovals
+
+        positions = np.rint(self._particles[:, :2]).astype(np.int32)
+        radius, intensity = self._particles[:, 3], self._particles[:, 4]
+        levels = (intensity * (INTENSITY_LEVELS - 1)).astype(np.int16)
+
+        visible = intensity >= INTENSITY_THRESHOLD
+        shown = visible & ~self._visible
+        hidden = ~visible & self._visible
+        moved = visible & np.any(positions != self._rendered_positions, axis=1)
+        recolored = visible & (levels != self._rendered_levels)
+
+        commands = [f"{path} itemconfigure {ovals[i]} -state hidden" for i in np.flatnonzero(hidden).tolist()]
+        commands.extend(f"{path} itemconfigure {ovals[i]} -state normal" for i in np.flatnonzero(shown).tolist())
+
+        moved_indices = np.flatnonzero(moved)
+        centers = positions[moved_indices]
+        radii = radius[moved_indices, np.newaxis].astype(np.float64).round(1)
+        boxes = np.hstack((centers - radii, centers + radii)).tolist()
+        for i, (x1, y1, x2, y2) in zip(moved_indices.tolist(), boxes):
+            commands.append(f"{path} coords {ovals[i]} {x1} {y1} {x2} {y2}")
+
+        recolored_indices = np.flatnonzero(recolored)
+        for i, level in zip(recolored_indices.tolist(), levels[recolored_indices].tolist()):
+            commands.append(f"{path} itemconfigure {ovals[i]} -fill {GRAY_LEVELS[level]}")
+
+        self._visible = visible
+        self._rendered_positions[moved_indices] = centers
+        self._rendered_levels[recolored_indices] = levels[recolored_indices]
+        canvas.execute_batch(commands)
 
     def _on_resize(self, _width: int, _height: int) -> None:
         """
         Handle window resize events
         """
-        self._initialize_particles()
\ No newline at end of file
+        self._initialize_particles()
+
+    def _on_quality_changed(self, level: float) -> None:
+        """
+        Handle quality changes, the particle count follows the quality level
+        """
+        self._quality = level
+        self._resize_particles()
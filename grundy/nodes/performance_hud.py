@@ -0,0 +1,271 @@
+import time
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from grundy.core.events import EventType
+from grundy.core.node import Node
+from grundy.core.profiling import EventProfiler
+from grundy.core.quality import percentile
+
+
+@dataclass
+class NodeConfig:
+    """
+    Configuration for the PerformanceHud node.
+    """
+    toggle_key: str = "<F3>"
+    refresh_interval: float = 0.5  # Seconds between two refreshes of the figures
+    padding: int = 10
+    font: tuple = ("Courier", 10)
+    text_color: str = "#00FF00"
+    background_color: str = "#000000"
+    sparkline_color: str = "#FFD700"
+    budget_color: str = "#FF4040"
+    sparkline_width: int = 240
+    sparkline_height: int = 40
+    max_listeners: int = 5
+
+
+class PerformanceHudNode(Node):
+    """
+    Node which overlays frame timings on top of the scene, hidden until its key is pressed.
+
+    It shows the frame rate, a sparkline of the recent frame periods against the
+    frame budget, the number of canvas items, the Tcl commands sent per frame
+    and what each UPDATE listener costs per frame. Canvas call counting and
+    listener profiling are only enabled while the overlay is shown.
+
+    Every scene holds its own node, the visibility and the profiler are shared
+    by all of them so the overlay and its figures carry over scene switches.
+    """
+    _visible = False
+    # Profiler enabled by the HUD, left alone when profiling was enabled elsewhere
+    _profiler: Optional[EventProfiler] = None
+
+    def __init__(self, engine):
+        """
+        Initialize the performance HUD node.
+        """
+        super().__init__(engine)
+        self._tag = f"hud-{id(self)}"
+        self.config = NodeConfig()
+
+        self._key_binding_id: Optional[str] = None
+
+        self._text_item: Optional[int] = None
+        self._sparkline_item: Optional[int] = None
+        self._budget_item: Optional[int] = None
+        self._background_item: Optional[int] = None
+
+        # Counters at the last refresh, figures are averaged over the frames since then
+        self._last_refresh_time = 0.0
+        self._last_frame_count = 0
+        self._last_tk_calls = 0
+        self._last_listener_ns: Dict[str, int] = {}
+
+    @property
+    def visible(self) -> bool:
+        """
+        Check if the overlay is currently shown
+        """
+        return PerformanceHudNode._visible
+
+    def on_activated(self) -> None:
+        """
+        Handle node activation
+        """
+        self._key_binding_id = self.engine.viewport.bind(self.config.toggle_key, self._on_toggle)
+        if self.visible:
+            self._show()
+
+    def on_deactivated(self) -> None:
+        """
+        Handle node deactivation
+        """
+        self.engine.viewport.unbind(self.config.toggle_key, self._key_binding_id)
+        if self.visible:
+            # Measuring goes on, the next scene's node shows the overlay again
+            self._remove_items()
+
+    def toggle(self) -> None:
+        """
+        Show the overlay if it is hidden, hide it otherwise
+        """
+        PerformanceHudNode._visible = not self.visible
+        if not self.active:
+            return
+        if self.visible:
+            self._show()
+        else:
+            self._remove_items()
+            self._stop_measuring()
+
+    def _on_toggle(self, _event) -> None:
+        """
+        Handle the toggle key
+        """
+        self.toggle()
+
+    def _show(self) -> None:
+        """
+        Create the overlay and start measuring
+        """
+        self._start_measuring()
+        self.engine.events.subscribe(EventType.UPDATE, self._on_update)
+        self._create_items()
+        self._reset_counters(time.perf_counter())
+
+    def _remove_items(self) -> None:
+        """
+        Remove the overlay from the canvas
+        """
+        self.engine.events.unsubscribe(EventType.UPDATE, self._on_update)
+        self.engine.canvas.delete(self._tag)
+
+    def _start_measuring(self) -> None:
+        """
+        Count canvas calls and profile listeners, unless already done
+        """
+        engine = self.engine
+        engine.canvas.set_call_counting(True)
+        if engine.events.profiler is None:
+            PerformanceHudNode._profiler = engine.events.enable_profiling()
+
+    def _stop_measuring(self) -> None:
+        """
+        Stop counting canvas calls, and profiling listeners if the HUD started it
+        """
+        engine = self.engine
+        engine.canvas.set_call_counting(False)
+        profiler = PerformanceHudNode._profiler
+        if profiler is not None and engine.events.profiler is profiler:
+            engine.events.disable_profiling()
+        PerformanceHudNode._profiler = None
+
+    def _create_items(self) -> None:
+        """
+        Render the overlay items, filled in on the next refresh.
+        """
+        canvas = self.engine.canvas
+        config = self.config
+        x, y = config.padding, config.padding
+
+        self._background_item = canvas.create_rectangle(
+            x, y, x, y,
+            fill=config.background_color,
+            outline="",
+            stipple="gray50",
+            tags=self._tag
+        )
+        self._text_item = canvas.create_text(
+            x + config.padding,
+            y + config.padding,
+            text="Measuring...",
+            fill=config.text_color,
+            font=config.font,
+            anchor="nw",
+            tags=self._tag
+        )
+        self._budget_item = canvas.create_line(0, 0, 0, 0, fill=config.budget_color, dash=(2, 2), tags=self._tag)
+        self._sparkline_item = canvas.create_line(0, 0, 0, 0, fill=config.sparkline_color, tags=self._tag)
+
+    def _reset_counters(self, current_time: float) -> None:
+        """
+        Take the counters as the starting point of the next refresh.
+        """
+        self._last_refresh_time = current_time
+        self._last_frame_count = self.engine.frame_count
+        self._last_tk_calls = self.engine.canvas.tk_calls
+        profiler = self.engine.events.profiler
+        self._last_listener_ns = self._listener_totals(profiler) if profiler else {}
+
+    @staticmethod
+    def _listener_totals(profiler: EventProfiler) -> Dict[str, int]:
+        """
+        Get the total time of each UPDATE listener, in nanoseconds.
+        """
+        totals: Dict[str, int] = {}
+        for entry in profiler.get_stats(EventType.UPDATE):
+            totals[entry.listener] = totals.get(entry.listener, 0) + entry.total_ns
+        return totals
+
+    def _on_update(self, current_time: float, delta_time: float) -> None:
+        """
+        Refresh the figures every refresh_interval seconds.
+        """
+        if current_time - self._last_refresh_time >= self.config.refresh_interval:
+            self._refresh(current_time)
+
+    def _refresh(self, current_time: float) -> None:
+        """
+        Update the overlay text and sparkline from the engine timings.
+        """
+        engine = self.engine
+        canvas = engine.canvas
+        config = self.config
+
+        frames = max(1, engine.frame_count - self._last_frame_count)
+        elapsed = current_time - self._last_refresh_time
+        history = engine.frame_history
+        budget = engine.frame_budget
+
+        p90 = percentile([period for period, _ in history], 0.9) if history else 0.0
+        work = percentile([work_time for _, work_time in history], 0.5) if history else 0.0
+
+        lines = [
+            f"FPS {frames / elapsed if elapsed > 0 else 0.0:5.1f} / {engine.get_target_fps():.0f}"
+            f"   quality {engine.quality.level:.2f}",
+            f"frame p90 {p90 * 1000:5.1f} ms   work {work * 1000:5.1f} ms",
+            f"items {len(canvas.find_all())}   Tk calls/frame {(canvas.tk_calls - self._last_tk_calls) / frames:.1f}",
+        ]
+
+        profiler = engine.events.profiler
+        if profiler is not None:
+            totals = self._listener_totals(profiler)
+            costs = sorted(
+                ((total - self._last_listener_ns.get(name, 0), name) for name, total in totals.items()),
+                reverse=True
+            )
+            lines.append("UPDATE per frame:")
+            for cost, name in costs[:config.max_listeners]:
+                lines.append(f"  {cost / frames / 1e6:6.2f} ms  {name}")
+
+        canvas.itemconfigure(self._text_item, text="\n".join(lines))
+        self._layout(history, budget)
+        canvas.tag_raise(self._tag)
+
+        self._reset_counters(current_time)
+
+    def _layout(self, history: List[Tuple[float, float]], budget: float) -> None:
+        """
+        Place the sparkline under the text and fit the background around both.
+        The sparkline scale tops at twice the frame budget, drawn as a dashed line.
+        """
+        canvas = self.engine.canvas
+        config = self.config
+
+        left, top, right, bottom = canvas.bbox(self._text_item)
+        x0 = config.padding * 2
+        y0 = bottom + config.padding
+        width, height = config.sparkline_width, config.sparkline_height
+        y_bottom = y0 + height
+
+        scale = height / (2 * budget) if budget > 0 else 0.0
+        coords = []
+        count = max(1, len(history) - 1)
+        for i, (period, _) in enumerate(history):
+            coords.append(x0 + width * i / count)
+            coords.append(y_bottom - min(height, period * scale))
+        if len(coords) < 4:
+            coords = [x0, y_bottom, x0 + width, y_bottom]
+
+        canvas.coords(self._sparkline_item, *coords)
+        canvas.coords(self._budget_item, x0, y_bottom - height / 2, x0 + width, y_bottom - height / 2)
+        canvas.coords(
+            self._background_item,
+            config.padding,
+            config.padding,
+            max(right, x0 + width) + config.padding,
+            y_bottom + config.padding
+        )
@@ -2,6 +2,7 @@ from grundy.core.scene import Scene
 from grundy.nodes.gradient_background import GradientBackgroundNode
 from grundy.nodes.game_over import GameOverNode
 from grundy.nodes.flashing_text import FlashingTextNode
+from grundy.nodes.performance_hud import PerformanceHudNode
 
 
 class GameOverScene(Scene):
@@ -21,6 +22,9 @@ class GameOverScene(Scene):
         click_play = FlashingTextNode(self.engine, "Click to play again")
         self.add_node(click_play)
 
+        performance_hud = PerformanceHudNode(self.engine)
+        self.add_node(performance_hud)
+
     def on_entry(self) -> None:
         self._onclick_id = self.engine.viewport.bind("<Button-1>", self._on_click)
 
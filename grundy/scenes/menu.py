@@ -3,6 +3,7 @@ from grundy.nodes.gradient_background import GradientBackgroundNode
 from grundy.nodes.flashing_text import FlashingTextNode
 from grundy.nodes.cooling_tower import CoolingTowerNode
 from grundy.nodes.power_plant import PowerPlantNode
+from grundy.nodes.performance_hud import PerformanceHudNode
 
 
 class MenuScene(Scene):
@@ -28,6 +29,9 @@ class MenuScene(Scene):
         click_play = FlashingTextNode(self.engine, "Click to play", "top")
         self.add_node(click_play)
 
+        performance_hud = PerformanceHudNode(self.engine)
+        self.add_node(performance_hud)
+
     def on_entry(self) -> None:
         self._onclick_id = self.engine.viewport.bind("<Button-1>", self._on_click)
 
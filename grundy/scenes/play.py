@@ -3,6 +3,7 @@ from grundy.nodes.move_history import MoveHistoryNode
 from grundy.nodes.gradient_background import GradientBackgroundNode
 from grundy.nodes.particles import ParticlesNode
 from grundy.nodes.atoms import AtomsNode
+from grundy.nodes.performance_hud import PerformanceHudNode
 
 
 class PlayScene(Scene):
@@ -28,6 +29,9 @@ class PlayScene(Scene):
         move_history = MoveHistoryNode(self.engine)
         self.add_node(move_history)
 
+        performance_hud = PerformanceHudNode(self.engine)
+        self.add_node(performance_hud)
+
     def on_entry(self) -> None:
         pass
 
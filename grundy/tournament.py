@@ -0,0 +1,253 @@
+"""
+Display-less self-play tournament between computer strategies.
+
+Usage: python -m grundy.tournament --games 1000 --first optimal --second random
+"""
+
+import argparse
+import os
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from grundy.core.computer import Computer
+from grundy.core.events import EventType
+from grundy.core.headless import HeadlessEngine, Move, PlayerStrategy
+from grundy.core.state import GameState
+from grundy.utils.cli import pilesize, positive_int
+
+
+def optimal_strategy(engine: HeadlessEngine) -> Move:
+    """
+    Play a move leaving a zero nim-sum, or a random move if there is none.
+    """
+    pile_id, position = engine.computer.find_winning_move()
+    if pile_id is None or position is None:
+        return engine.computer.think_random()
+    return pile_id, position
+
+
+def random_strategy(engine: HeadlessEngine) -> Move:
+    """
+    Play a uniformly random split.
+    """
+    return engine.computer.think_random()
+
+
+def epsilon_greedy_strategy(epsilon: float) -> PlayerStrategy:
+    """
+    Play randomly with probability epsilon, optimally otherwise.
+    """
+    def strategy(engine: HeadlessEngine) -> Move:
+        if random.random() < epsilon:
+            return random_strategy(engine)
+        return optimal_strategy(engine)
+    return strategy
+
+
+def search_strategy(depth: int) -> PlayerStrategy:
+    """
+    Play the move found by a depth-limited negamax over game states,
+    without using Grundy values. Positions past the horizon score as unknown.
+    """
+    memo: Dict[Tuple[GameState, int], int] = {}
+
+    def negamax(state: GameState, remaining: int) -> int:
+        # 1 when the player to move wins, -1 when it loses, 0 when unknown
+        if state.is_terminal():
+            return -1
+        if remaining == 0:
+            return 0
+
+        key = (state, remaining)
+        if key in memo:
+            return memo[key]
+
+        best = -1
+        for _, _, child in state.children():
+            best = max(best, -negamax(child, remaining - 1))
+            if best == 1:
+                break
+
+        memo[key] = best
+        return best
+
+    def strategy(engine: HeadlessEngine) -> Move:
+        best_score, best_moves = -2, []
+        for size, position, child in engine.logic.get_state().children():
+            score = -negamax(child, depth - 1)
+            if score > best_score:
+                best_score, best_moves = score, []
+            if score == best_score:
+                best_moves.append((size, position))
+
+        if not best_moves:
+            return None, None
+
+        size, position = random.choice(best_moves)
+        pile = next(pile for pile in engine.logic.get_piles().values() if pile.size == size)
+        return pile.id, position
+
+    return strategy
+
+
+def parse_strategy(value: str) -> str:
+    """
+    Custom type for argparse validating a strategy specification:
+    'optimal', 'random', 'epsilon:<rate>' or 'search:<depth>'.
+    """
+    try:
+        build_strategy(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error))
+    return value
+
+
+def build_strategy(spec: str) -> PlayerStrategy:
+    """
+    Build a strategy from its specification.
+    """
+    name, _, arg = spec.partition(":")
+    if name == "optimal" and not arg:
+        return optimal_strategy
+    if name == "random" and not arg:
+        return random_strategy
+    if name == "epsilon":
+        epsilon = float(arg or 0.1)
+        if not 0 <= epsilon <= 1:
+            raise ValueError(f"Epsilon must be between 0 and 1 (got {epsilon})")
+        return epsilon_greedy_strategy(epsilon)
+    if name == "search":
+        depth = int(arg or 3)
+        if depth < 1:
+            raise ValueError(f"Search depth must be at least 1 (got {depth})")
+        return search_strategy(depth)
+    raise ValueError(f"Unknown strategy: {spec}")
+
+
+class StrategyComputer(Computer):
+    """
+    Computer whose moves come from a tournament strategy.
+    """
+
+    def __init__(self, engine: HeadlessEngine, strategy: PlayerStrategy) -> None:
+        super().__init__(engine)
+        self._strategy = strategy
+
+    def think(self) -> Move:
+        return self._strategy(self.engine)
+
+
+@dataclass
+class GameSettings:
+    """
+    Settings shared by every game of a tournament.
+    """
+    first: str
+    second: str
+    piles: Optional[List[int]] = None
+    cheat: bool = False
+
+
+def _play_games(settings: GameSettings, seeds: List[int]) -> List[Tuple[int, int]]:
+    """
+    Play one game per seed in this process.
+    Returns a (winner, move count) tuple per game.
+    """
+    engine = HeadlessEngine()
+    engine.computer = StrategyComputer(engine, build_strategy(settings.second))
+    engine.computer.set_verbose(False)
+    engine.computer.set_cheat_mode(settings.cheat)
+    first = build_strategy(settings.first)
+
+    moves = 0
+
+    def on_move(*_) -> None:
+        nonlocal moves
+        moves += 1
+
+    engine.events.subscribe(EventType.MOVE_MADE, on_move)
+    engine.logic.set_initial_piles(settings.piles)
+
+    results = []
+    for seed in seeds:
+        random.seed(seed)
+        moves = 0
+        winner = engine.play(first)
+        results.append((winner, moves))
+    return results
+
+
+def run_tournament(
+    settings: GameSettings,
+    games: int,
+    workers: int,
+    seed: int
+) -> Tuple[List[Tuple[int, int]], float]:
+    """
+    Play games across a process pool, each seeded with seed + its index.
+    Returns the per game results and the elapsed time in seconds.
+    """
+    seeds = [seed + i for i in range(games)]
+    chunk = max(1, -(-games // (workers * 4)))
+    chunks = [seeds[i:i + chunk] for i in range(0, games, chunk)]
+
+    start = time.perf_counter()
+    results: List[Tuple[int, int]] = []
+    if workers == 1:
+        for seeds_chunk in chunks:
+            results.extend(_play_games(settings, seeds_chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_results in executor.map(_play_games, [settings] * len(chunks), chunks):
+                results.extend(chunk_results)
+
+    return results, time.perf_counter() - start
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Grundy's Game Tournament")
+
+    parser.add_argument("--games", "-n", type=positive_int, default=1000, help="number of games to play (default: 1000)")
+    parser.add_argument(
+        "--first", type=parse_strategy, default="optimal",
+        help="strategy of player 1: optimal, random, epsilon:<rate> or search:<depth> (default: 'optimal')"
+    )
+    parser.add_argument(
+        "--second", type=parse_strategy, default="random",
+        help="strategy of player 2, same choices as --first (default: 'random')"
+    )
+    parser.add_argument("--piles", "-p", type=pilesize, nargs="+", help="set predefined initial piles sizes (e.g., --piles 7 5 3)")
+    parser.add_argument("--cheat", action="store_true", help="let player 2 choose who starts (default: False)")
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count() or 1, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game (default: 0)")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    settings = GameSettings(args.first, args.second, args.piles, args.cheat)
+
+    results, elapsed = run_tournament(settings, args.games, args.workers, args.seed)
+
+    games = len(results)
+    if games == 0:
+        print("No game played.")
+        return
+
+    first_wins = sum(1 for winner, _ in results if winner == 1)
+    second_wins = sum(1 for winner, _ in results if winner == 2)
+    average_length = sum(moves for _, moves in results) / games
+
+    print(f"{games} games, {args.first} (player 1) vs {args.second} (player 2)")
+    print(f"  player 1 wins: {first_wins:>8} ({first_wins / games:.1%})")
+    print(f"  player 2 wins: {second_wins:>8} ({second_wins / games:.1%})")
+    print(f"  average length: {average_length:.2f} moves")
+    print(f"  throughput: {games / elapsed:.0f} games/sec over {args.workers} workers")
+
+if __name__ == "__main__":
+    main()
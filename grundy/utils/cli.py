@@ -0,0 +1,33 @@
+"""
+Argument types shared by the command-line entry points.
+"""
+
+import argparse
+
+
+def pilesize(value):
+    """
+    Custom type for argparse that ensures pile sizes are at least 3.
+    """
+    ivalue = int(value)
+    if ivalue < 3:
+        raise argparse.ArgumentTypeError(f"Pile size must be at least 3 (got {ivalue})")
+    return ivalue
+
+def positive_int(value):
+    """
+    Custom type for argparse that ensures an integer is strictly positive.
+    """
+    ivalue = int(value)
+    if ivalue <= 0:
+        raise argparse.ArgumentTypeError(f"Value must be positive (got {ivalue})")
+    return ivalue
+
+def positive_float(value):
+    """
+    Custom type for argparse that ensures a number is strictly positive.
+    """
+    fvalue = float(value)
+    if fvalue <= 0:
+        raise argparse.ArgumentTypeError(f"Value must be positive (got {fvalue})")
+    return fvalue
@@ -0,0 +1,92 @@
+"""
+Raster helpers producing image data Tk can load without extra dependencies.
+"""
+
+import struct
+import zlib
+import numpy as np
+
+from typing import Literal
+
+from grundy.utils.colors import RGBColor
+
+
+def encode_ppm(rgb: np.ndarray) -> bytes:
+    """
+    Encode a (height, width, 3) uint8 array as a binary PPM image.
+    """
+    height, width, _ = rgb.shape
+    return f"P6 {width} {height} 255\n".encode("ascii") + np.ascontiguousarray(rgb, dtype=np.uint8).tobytes()
+
+
+def encode_png(rgba: np.ndarray) -> bytes:
+    """
+    Encode a (height, width, 4) uint8 array as a PNG image, keeping transparency.
+    """
+    height, width, _ = rgba.shape
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    # Every scanline starts with filter type 0 (none)
+    raw = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = rgba.reshape(height, width * 4)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw.tobytes()))
+        + chunk(b"IEND", b"")
+    )
+
+
+def linear_gradient_strip(
+    start_rgb: RGBColor,
+    end_rgb: RGBColor,
+    length: int,
+    direction: Literal['horizontal', 'vertical']
+) -> np.ndarray:
+    """
+    Rasterize a one pixel thick strip going from start_rgb to end_rgb.
+    Returns a (1, length, 3) array for horizontal gradients, (length, 1, 3) otherwise.
+    """
+    t = np.arange(length, dtype=np.float64)[:, np.newaxis] / max(length, 1)
+    start = np.array(start_rgb, dtype=np.float64)
+    end = np.array(end_rgb, dtype=np.float64)
+    colors = (start + (end - start) * t).astype(np.uint8)
+
+    if direction == "horizontal":
+        return colors[np.newaxis, :, :]
+    return colors[:, np.newaxis, :]
+
+
+def radial_gradient_disc(
+    radius: int,
+    start_rgb: RGBColor,
+    end_rgb: RGBColor,
+    steps: int
+) -> np.ndarray:
+    """
+    Rasterize the concentric circles drawn by Canvas.create_gradient_circle,
+    from start_rgb on the outer ring to end_rgb at the center.
+    Returns a (2 * radius + 1, 2 * radius + 1, 4) array, transparent outside the disc.
+    """
+    size = 2 * radius + 1
+    offsets = np.arange(size, dtype=np.float64) - radius
+    distance = np.hypot(offsets[np.newaxis, :], offsets[:, np.newaxis])
+
+    # Innermost of the drawn circles covering each pixel, they all overlap when steps exceed the radius
+    step_radius = radius // steps
+    if step_radius:
+        ring = np.clip(np.floor((radius - distance) / step_radius), 0, steps - 1)
+    else:
+        ring = np.full_like(distance, steps - 1)
+    t = ring / max(steps - 1, 1)
+
+    start = np.array(start_rgb, dtype=np.float64)
+    end = np.array(end_rgb, dtype=np.float64)
+
+    rgba = np.zeros((size, size, 4), dtype=np.uint8)
+    rgba[..., :3] = (start + (end - start) * t[..., np.newaxis]).astype(np.uint8)
+    rgba[..., 3] = np.where(distance <= radius, 255, 0)
+    return rgba